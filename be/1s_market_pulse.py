@@ -9,35 +9,76 @@ import sys
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-import json
+import calendar
 import re
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from google import genai
 from google.genai import types
 import feedparser
+from pydantic import BaseModel, ValidationError
 
 # Load environment variables
 from pathlib import Path
 root_dir = Path(__file__).resolve().parent
 load_dotenv(dotenv_path=root_dir / '.env')
 
-# Configure Gemini AI
-GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
-if not GEMINI_API_KEY or GEMINI_API_KEY == 'your_gemini_api_key_here':
-    raise ValueError("Please set GEMINI_API_KEY in .env file")
-
-client = genai.Client(api_key=GEMINI_API_KEY)
-
-# Database
-ARGUS_FINTEL_DB = os.getenv('ARGUS_FINTEL_DB')
-if not ARGUS_FINTEL_DB:
-    raise ValueError("ARGUS_FINTEL_DB not found in .env file")
-engine = create_engine(ARGUS_FINTEL_DB, pool_pre_ping=True)
+# Gemini client and DB engine are created on first use and reused, so importing
+# this module (tests, other scripts) neither needs the env vars nor pays setup cost.
+@lru_cache(maxsize=1)
+def get_client():
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key or api_key == 'your_gemini_api_key_here':
+        raise ValueError("Please set GEMINI_API_KEY in .env file")
+    return genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    db_url = os.getenv('ARGUS_FINTEL_DB')
+    if not db_url:
+        raise ValueError("ARGUS_FINTEL_DB not found in .env file")
+    # One short run per process: connections are always fresh, so skip the
+    # per-checkout pre-ping round trip.
+    return create_engine(db_url)
+
+# Statements are built once at import and reused by every call below.
+_SELECT_SEEN_URLS = text("""
+    SELECT DISTINCT url FROM mri_analysis
+    WHERE generated_at > NOW() - INTERVAL '48 hours'
+      AND url = ANY(:urls)
+""")
+
+_SELECT_LAST_RUN_AGE = text("SELECT NOW() - MAX(generated_at) FROM mri_analysis")
+
+_SELECT_FEED_STATE = text("SELECT url, etag, modified FROM rss_feed_state")
+
+_UPSERT_FEED_STATE = text("""
+    INSERT INTO rss_feed_state (url, etag, modified, checked_at)
+    VALUES (:url, :etag, :modified, NOW())
+    ON CONFLICT (url) DO UPDATE
+    SET etag = EXCLUDED.etag, modified = EXCLUDED.modified, checked_at = NOW()
+""")
+
+_INSERT_ITEM = text("""
+    INSERT INTO mri_analysis
+    (title, brief_content, source_name, source_date, url, label, mri, generated_at, lang)
+    VALUES
+    (:title, :brief, :source, :source_date, :url, :label, :mri, :generated_at, :lang)
+""")
+
+FEED_WORKERS = 8  # concurrent RSS fetches
+_TAG_RE = re.compile(r'<[^>]+>')  # strips HTML tags from feed summaries
+
+# A run younger than this is treated as "already done" (cron and the admin
+# trigger can overlap); skipping it saves the crawl and the Gemini call.
+MIN_RUN_INTERVAL = timedelta(hours=float(os.getenv('MARKET_PULSE_MIN_INTERVAL_HOURS', '1')))
 
 # ==============================
 # RSS FEED SOURCES
@@ -118,97 +159,189 @@ RSS_FEEDS = [
 # ==============================
 # CRAWL RSS FEEDS
 # ==============================
-def crawl_rss_feeds(hours=24):
-    """Crawl RSS feeds and return articles from the last N hours"""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+def _fetch_feed(feed_info, cutoff_ts, fetched_at, prev=None):
+    """Fetch one feed and return (articles, error, validators) — never raises,
+    so one bad feed cannot take down the whole batch.
+
+    `prev` holds the etag/modified from the last run; they are sent as
+    conditional headers and a 304 comes back as articles=None with no body
+    downloaded. `validators` are the new values to remember (None if absent).
+    """
     articles = []
+    validators = None
+    try:
+        prev = prev or {}
+        feed = feedparser.parse(feed_info["url"], etag=prev.get("etag"), modified=prev.get("modified"))
+        if feed.get("status") == 304:
+            return None, None, None
+        if feed.get("etag") or feed.get("modified"):
+            validators = {"etag": feed.get("etag"), "modified": feed.get("modified")}
+        for entry in feed.entries[:20]:
+            # feedparser gives UTC struct_time; compare as epoch seconds and
+            # only build a datetime for the entries we keep.
+            parsed = getattr(entry, 'published_parsed', None) or getattr(entry, 'updated_parsed', None)
+
+            # Skip old articles
+            if parsed and calendar.timegm(parsed) < cutoff_ts:
+                continue
+
+            title = entry.get('title', '').strip()
+            summary = entry.get('summary', entry.get('description', '')).strip()
+            link = entry.get('link', '').strip()
+
+            if not title or not link:
+                continue
+
+            # Clean HTML tags from summary
+            summary = _TAG_RE.sub('', summary).strip()[:500]
+
+            articles.append({
+                "title": title,
+                "summary": summary,
+                "url": link,
+                "source": feed_info["name"],
+                "published": (datetime(*parsed[:6], tzinfo=timezone.utc).isoformat()
+                              if parsed else fetched_at)
+            })
+    except Exception as e:
+        return articles, e, None
+    return articles, None, validators
 
-    for feed_info in RSS_FEEDS:
-        count = 0
-        try:
-            feed = feedparser.parse(feed_info["url"])
-            for entry in feed.entries[:20]:
-                # Parse published date
-                pub_date = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    pub_date = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    pub_date = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-
-                # Skip old articles
-                if pub_date and pub_date < cutoff:
-                    continue
-
-                title = entry.get('title', '').strip()
-                summary = entry.get('summary', entry.get('description', '')).strip()
-                link = entry.get('link', '').strip()
-
-                if not title or not link:
-                    continue
-
-                # Clean HTML tags from summary
-                summary = re.sub(r'<[^>]+>', '', summary).strip()
-                summary = summary[:500]
-
-                articles.append({
-                    "title": title,
-                    "summary": summary,
-                    "url": link,
-                    "source": feed_info["name"],
-                    "published": pub_date.isoformat() if pub_date else datetime.now(timezone.utc).isoformat()
-                })
-                count += 1
-
-            print(f"  {feed_info['name']}: {count} articles")
-        except Exception as e:
-            print(f"  {feed_info['name']}: Failed - {e}")
 
-    return articles
+def crawl_rss_feeds(hours=24):
+    """Crawl RSS feeds and return (articles from the last N hours, new feed
+    validators, number of feeds not modified since the last run).
+
+    The validators are not saved here: main() persists them only once the
+    articles have been deduped, filtered and saved, so a failed run re-reads
+    the same feeds next time instead of getting 304s for them."""
+    # One clock read per run: the cutoff and the fallback timestamp for undated
+    # entries must agree, and isoformat() is done once instead of per entry.
+    now = datetime.now(timezone.utc)
+    cutoff_ts = (now - timedelta(hours=hours)).timestamp()
+    fetched_at = now.isoformat()
+    articles = []
+    state = load_feed_state()
+    new_state = []
+    unchanged = 0
+
+    # Fetching is network-bound (1-3s per feed), so run the feeds concurrently;
+    # map() keeps RSS_FEEDS order for the output and the log lines.
+    with ThreadPoolExecutor(max_workers=FEED_WORKERS) as pool:
+        results = pool.map(
+            lambda f: _fetch_feed(f, cutoff_ts, fetched_at, state.get(f["url"])), RSS_FEEDS
+        )
+        for feed_info, (feed_articles, err, validators) in zip(RSS_FEEDS, results):
+            if err is not None:
+                print(f"  {feed_info['name']}: Failed - {err}")
+                continue
+            if feed_articles is None:
+                print(f"  {feed_info['name']}: not modified since last run")
+                unchanged += 1
+                continue
+            print(f"  {feed_info['name']}: {len(feed_articles)} articles")
+            articles.extend(feed_articles)
+            if validators:
+                new_state.append({"url": feed_info["url"], **validators})
+
+    return articles, new_state, unchanged
+
+
+def load_feed_state():
+    """{feed url: {"etag", "modified"}} from the last run (migration 015).
+    Missing state only costs full downloads, so errors are not fatal."""
+    try:
+        with get_engine().connect() as conn:
+            rows = conn.execute(_SELECT_FEED_STATE).fetchall()
+        return {r[0]: {"etag": r[1], "modified": r[2]} for r in rows}
+    except Exception as e:
+        print(f"  Feed state unavailable ({type(e).__name__}), fetching all feeds in full")
+        return {}
+
+
+def save_feed_state(rows):
+    if not rows:
+        return
+    try:
+        with get_engine().begin() as conn:
+            conn.execute(_UPSERT_FEED_STATE, rows)
+    except Exception as e:
+        print(f"  Could not save feed state: {type(e).__name__}: {str(e)[:140]}")
 
 
 # ==============================
 # DEDUPLICATION
 # ==============================
-def get_existing_urls():
-    """Get URLs already in the database to avoid duplicates"""
-    with engine.connect() as conn:
-        # Ensure table exists
-        conn.execute(text("""
-            CREATE TABLE IF NOT EXISTS mri_analysis (
-                id SERIAL PRIMARY KEY,
-                title TEXT NOT NULL,
-                brief_content TEXT,
-                source_name TEXT,
-                source_date TEXT,
-                url TEXT,
-                label TEXT,
-                mri INTEGER,
-                generated_at TIMESTAMP,
-                lang TEXT DEFAULT 'vi'
-            )
-        """))
-        conn.commit()
-
-        # Add lang column if missing (for existing tables)
-        try:
-            conn.execute(text("""
-                ALTER TABLE mri_analysis ADD COLUMN IF NOT EXISTS lang TEXT DEFAULT 'vi'
-            """))
-            conn.commit()
-        except Exception:
-            pass
-
-        # Get URLs from last 48 hours for dedup
-        result = conn.execute(text("""
-            SELECT DISTINCT url FROM mri_analysis
-            WHERE generated_at > NOW() - INTERVAL '48 hours'
-        """))
+def get_existing_urls(urls):
+    """Return which of the crawled `urls` were already saved in the last 48h.
+
+    The match runs in Postgres (idx_mri_analysis_url_generated_at, migration
+    014), so only the overlap comes back instead of every recent URL. The
+    mri_analysis schema is owned by migrations/013_mri_analysis.sql — this is
+    a read-only lookup, no per-run DDL.
+    """
+    if not urls:
+        return set()
+    with get_engine().connect() as conn:
+        result = conn.execute(_SELECT_SEEN_URLS, {"urls": list(urls)})
         return {row[0] for row in result.fetchall() if row[0]}
 
 
 # ==============================
 # GEMINI FILTERING
 # ==============================
+# Static instructions for gemini-2.5-flash; only the article block and counts
+# are filled in per run (str.format, so literal JSON braces are doubled).
+PULSE_PROMPT = """You are a global macro financial research assistant.
+
+From the following {n_articles} real news articles, select EXACTLY 5 that are MOST LIKELY to have HIGH IMPACT on Vietnam's financial market.
+
+Vietnam market scope:
+- VN-Index / equities
+- Banking system
+- Gold & precious metals
+- Real estate
+- FX / interest rates / commodities
+- Trade & geopolitics affecting ASEAN/Vietnam
+
+When several articles have comparable impact, prefer spreading the selection
+across DIFFERENT news sources rather than picking multiple from the same source.
+
+ARTICLES:
+{articles_text}
+
+For EACH selected item, return:
+- index: the article index number [0-{max_idx}]
+- title_vi: Vietnamese translation of the title
+- summary_vi: 2-sentence Vietnamese summary focusing on impact to Vietnam market
+- title_en: English title (keep original or slightly edited for clarity)
+- summary_en: 2-sentence English summary focusing on impact to Vietnam market
+- affected_market: one of (VNINDEX, GOLD, REAL_ESTATE, BANKING, FX)
+- impact_score: number from -1.0 to 1.0 (negative = bearish, positive = bullish), absolute value >= 0.5
+
+Return ONLY valid JSON (no markdown code blocks):
+
+{{
+  "items": [ ... exactly 5 items ... ]
+}}"""
+
+
+class PulseItem(BaseModel):
+    index: int
+    title_vi: str
+    summary_vi: str
+    title_en: str
+    summary_en: str
+    affected_market: str
+    impact_score: float
+
+
+class PulseResponse(BaseModel):
+    """Shape of the Gemini JSON. Parsed and validated in one pass by pydantic-core,
+    so an item missing a field fails here (and is retried) instead of in save_items."""
+    items: list[PulseItem] = []
+
+
 def filter_with_gemini(articles, existing_urls):
     """Use Gemini to filter and score articles for Vietnam market relevance"""
 
@@ -241,58 +374,32 @@ def filter_with_gemini(articles, existing_urls):
     new_articles = pooled
     print(f"   Gemini pool: {len(new_articles)} articles from {len(by_source)} sources")
 
-    articles_text = ""
-    for i, a in enumerate(new_articles):
-        articles_text += f"""[{i}] Title: {a['title']}
+    articles_text = "".join(
+        f"""[{i}] Title: {a['title']}
 Summary: {a['summary']}
 Source: {a['source']}
 URL: {a['url']}
 Published: {a['published']}
 ---
 """
+        for i, a in enumerate(new_articles)
+    )
 
-    prompt = f"""You are a global macro financial research assistant.
-
-From the following {len(new_articles)} real news articles, select EXACTLY 5 that are MOST LIKELY to have HIGH IMPACT on Vietnam's financial market.
-
-Vietnam market scope:
-- VN-Index / equities
-- Banking system
-- Gold & precious metals
-- Real estate
-- FX / interest rates / commodities
-- Trade & geopolitics affecting ASEAN/Vietnam
-
-When several articles have comparable impact, prefer spreading the selection
-across DIFFERENT news sources rather than picking multiple from the same source.
-
-ARTICLES:
-{articles_text}
-
-For EACH selected item, return:
-- index: the article index number [0-{len(new_articles)-1}]
-- title_vi: Vietnamese translation of the title
-- summary_vi: 2-sentence Vietnamese summary focusing on impact to Vietnam market
-- title_en: English title (keep original or slightly edited for clarity)
-- summary_en: 2-sentence English summary focusing on impact to Vietnam market
-- affected_market: one of (VNINDEX, GOLD, REAL_ESTATE, BANKING, FX)
-- impact_score: number from -1.0 to 1.0 (negative = bearish, positive = bullish), absolute value >= 0.5
-
-Return ONLY valid JSON (no markdown code blocks):
-
-{{
-  "items": [ ... exactly 5 items ... ]
-}}"""
+    prompt = PULSE_PROMPT.format(
+        n_articles=len(new_articles),
+        articles_text=articles_text,
+        max_idx=len(new_articles) - 1,
+    )
 
     def _parse_json_loose(text):
         # Even with response_mime_type=json, Gemini occasionally wraps output in
         # ```json fences or leaves a trailing comma — sanitise before giving up.
         t = re.sub(r'^```(?:json)?\s*|\s*```$', '', (text or '').strip())
         try:
-            return json.loads(t)
-        except json.JSONDecodeError:
+            return PulseResponse.model_validate_json(t)
+        except ValidationError:
             t = re.sub(r',(\s*[}\]])', r'\1', t)  # drop trailing commas
-            return json.loads(t)
+            return PulseResponse.model_validate_json(t)
 
     # gemini-2.5-flash is a thinking model: thinking tokens count against the
     # output budget and can truncate the JSON mid-string. Disable thinking, keep
@@ -308,6 +415,7 @@ Return ONLY valid JSON (no markdown code blocks):
 
     # Catch both malformed JSON and transient API errors (503 high-demand, 429
     # rate-limit) — both are common and both clear on a retry with backoff.
+    client = get_client()  # config errors must not be swallowed by the retry loop
     data, last_err, raw = None, None, ''
     for attempt in range(4):
         try:
@@ -325,7 +433,7 @@ Return ONLY valid JSON (no markdown code blocks):
         print(f"   Raw response (first 500 chars): {raw[:500]}")
         raise last_err
 
-    items = data.get("items", [])
+    items = [it.model_dump() for it in data.items]
 
     if len(items) != 5:
         print(f"   Warning: Expected 5 items, got {len(items)}")
@@ -333,7 +441,7 @@ Return ONLY valid JSON (no markdown code blocks):
     # Merge with original article data (real URLs from RSS)
     results = []
     for item in items:
-        idx = item.get("index", -1)
+        idx = item["index"]
         if 0 <= idx < len(new_articles):
             original = new_articles[idx]
             item["url"] = original["url"]       # Always use real URL from RSS
@@ -353,66 +461,65 @@ def save_items(items):
     """Save items to mri_analysis table (both VI and EN versions)"""
     now = datetime.now(ZoneInfo("Asia/Ho_Chi_Minh"))
 
-    insert_sql = text("""
-        INSERT INTO mri_analysis
-        (title, brief_content, source_name, source_date, url, label, mri, generated_at, lang)
-        VALUES
-        (:title, :brief, :source, :source_date, :url, :label, :mri, :generated_at, :lang)
-    """)
-
-    with engine.begin() as conn:
-        for item in items:
-            # Vietnamese version
-            conn.execute(insert_sql, {
-                "title": item["title_vi"],
-                "brief": item["summary_vi"],
-                "source": item["source"],
-                "source_date": item["source_date"],
-                "url": item["url"],
-                "label": item["affected_market"],
-                "mri": int(float(item["impact_score"]) * 100),
-                "generated_at": now,
-                "lang": "vi"
-            })
-            # English version
-            conn.execute(insert_sql, {
-                "title": item["title_en"],
-                "brief": item["summary_en"],
-                "source": item["source"],
-                "source_date": item["source_date"],
-                "url": item["url"],
-                "label": item["affected_market"],
-                "mri": int(float(item["impact_score"]) * 100),
-                "generated_at": now,
-                "lang": "en"
-            })
+    rows = []
+    for item in items:
+        shared = {
+            "source": item["source"],
+            "source_date": item["source_date"],
+            "url": item["url"],
+            "label": item["affected_market"],
+            "mri": int(float(item["impact_score"]) * 100),
+            "generated_at": now,
+        }
+        # Vietnamese version
+        rows.append({**shared, "title": item["title_vi"], "brief": item["summary_vi"], "lang": "vi"})
+        # English version
+        rows.append({**shared, "title": item["title_en"], "brief": item["summary_en"], "lang": "en"})
+
+    if not rows:
+        return
+    # A list of params runs as one executemany; psycopg2 batches it into a
+    # single round trip instead of one per row.
+    with get_engine().begin() as conn:
+        conn.execute(_INSERT_ITEM, rows)
 
 
 # ==============================
 # MAIN
 # ==============================
-def main():
+def main(force=False):
     print("=" * 60)
     print("1s Market Pulse - RSS Pipeline")
     print("=" * 60)
 
+    if not force:
+        age = get_last_run_age()
+        if age is not None and age < MIN_RUN_INTERVAL:
+            print(f"\nLast batch saved {age.total_seconds() / 60:.0f} min ago "
+                  f"(< {MIN_RUN_INTERVAL}), skipping. Use --force to run anyway.")
+            return True
+
     # Step 1: Crawl RSS feeds
     print("\n1. Crawling RSS feeds (last 24h)...")
-    articles = crawl_rss_feeds(hours=24)
+    articles, feed_state, unchanged = crawl_rss_feeds(hours=24)
     print(f"   Total: {len(articles)} articles")
 
     if not articles:
+        if unchanged == len(RSS_FEEDS):
+            print("No feed changed since the last run, nothing to do")
+            return True
         print("No articles found from RSS feeds")
         return False
 
     # Step 2: Get existing URLs for dedup
     print("\n2. Checking for duplicates...")
-    existing_urls = get_existing_urls()
+    existing_urls = get_existing_urls({a["url"] for a in articles})
     new_count = len([a for a in articles if a["url"] not in existing_urls])
-    print(f"   {len(existing_urls)} existing URLs, {new_count} new articles")
+    print(f"   {len(existing_urls)} already-seen URLs, {new_count} new articles")
 
     if new_count == 0:
         print("   All articles already processed, skipping")
+        save_feed_state(feed_state)
         return True
 
     # Step 3: Filter with Gemini
@@ -426,6 +533,7 @@ def main():
     # Step 4: Save to DB
     print(f"\n4. Saving {len(items)} items (VI + EN) to database...")
     save_items(items)
+    save_feed_state(feed_state)
 
     print(f"\nMarket Pulse completed: {len(items)} items saved")
     for item in items:
@@ -436,5 +544,5 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    success = main(force='--force' in sys.argv[1:])
     sys.exit(0 if success else 1)
@@ -3,11 +3,15 @@ Auth0 JWT Token Verification
 Auth0-only authentication functions for VietDataverse API
 """
 
+import hashlib
 import os
-import json
-from jose import jwt, JWTError
-from urllib.request import urlopen
-from functools import lru_cache
+import time
+
+import jwt
+import requests
+from jwt import PyJWTError as JWTError
+
+from core.cache import TTLCache
 
 # Auth0 Configuration
 AUTH0_DOMAIN = os.getenv("AUTH0_DOMAIN")
@@ -19,16 +23,84 @@ AUTH0_CALLBACK_URL = os.getenv("AUTH0_CALLBACK_URL")
 LOGOUT_URL = os.getenv("LOGOUT_URL")
 NAMESPACE = "https://vietdataverse.online"
 
+# One keep-alive session for every call to the Auth0 tenant (JWKS, /userinfo,
+# /oauth/token) so repeat calls reuse the TLS connection instead of handshaking.
+_auth0_http = requests.Session()
+
+
+# JWKS changes only when Auth0 rotates signing keys; re-fetch hourly so a
+# rotation is picked up without restarting the process.
+JWKS_TTL = 3600
+_jwks_cache = TTLCache(JWKS_TTL, maxsize=1)
+
+# A token signed with a key we have not seen yet forces one JWKS re-fetch, so a
+# rotation is picked up at once instead of after JWKS_TTL. At most one forced
+# re-fetch per cooldown, so tokens with made-up kids cannot hammer Auth0.
+JWKS_REFRESH_COOLDOWN = 60
+_jwks_refreshed_at = float("-inf")
+
+# Verified claims keyed by the token's sha256: a client reuses one token for a
+# whole session, so RS256 checks (or /userinfo for opaque tokens) run once per
+# TOKEN_CACHE_TTL. Entries never outlive the JWT's own exp.
+TOKEN_CACHE_TTL = 60
+_token_cache = TTLCache(TOKEN_CACHE_TTL, maxsize=1024)
+
 
-@lru_cache(maxsize=1)
 def get_jwks():
-    """Fetch and cache Auth0 JWKS (JSON Web Key Set)"""
+    """Fetch Auth0 JWKS (JSON Web Key Set)"""
     jwks_url = f"https://{AUTH0_DOMAIN}/.well-known/jwks.json"
-    with urlopen(jwks_url) as response:
-        return json.loads(response.read())
+    response = _auth0_http.get(jwks_url, timeout=5)
+    response.raise_for_status()
+    return response.json()
+
+
+def get_signing_keys(refresh: bool = False) -> dict:
+    """{kid: RSA public key} from the JWKS — parsed once per cache period so
+    token verification is a dict lookup, not a key scan + JWK parse.
+    refresh=True skips the cache and re-fetches."""
+    keys = None if refresh else _jwks_cache.get("keys")
+    if keys is None:
+        keys = {
+            k["kid"]: jwt.PyJWK(k, algorithm="RS256").key
+            for k in get_jwks()["keys"]
+            if k.get("kty") == "RSA"
+        }
+        _jwks_cache.set("keys", keys)
+    return keys
+
+
+def _signing_key(kid):
+    """Signing key for `kid`, re-fetching the JWKS once (rate-limited by
+    JWKS_REFRESH_COOLDOWN) when the cached set does not have it."""
+    global _jwks_refreshed_at
+    rsa_key = get_signing_keys().get(kid)
+    if rsa_key is not None or kid is None:
+        return rsa_key
+    now = time.monotonic()
+    if now - _jwks_refreshed_at < JWKS_REFRESH_COOLDOWN:
+        return None
+    _jwks_refreshed_at = now
+    try:
+        return get_signing_keys(refresh=True).get(kid)
+    except requests.RequestException:
+        return None
 
 
 def verify_auth0_token(token: str) -> dict:
+    """Verify an Auth0 token, memoized for TOKEN_CACHE_TTL seconds (see
+    _verify_auth0_token). Invalid tokens are never cached."""
+    key = hashlib.sha256(token.encode()).digest()
+    hit = _token_cache.get(key)
+    if hit is not None:
+        expires_at, claims = hit
+        if expires_at is None or expires_at > time.time():
+            return dict(claims)
+    claims = _verify_auth0_token(token)
+    _token_cache.set(key, (claims.get("exp"), claims))
+    return dict(claims)
+
+
+def _verify_auth0_token(token: str) -> dict:
     """
     Verify an Auth0 token — supports both JWT (when audience is set) and
     opaque tokens (when audience is omitted in SPA config).
@@ -42,22 +114,10 @@ def verify_auth0_token(token: str) -> dict:
     # Detect format: JWT has exactly 3 dot-separated parts
     if len(token.split('.')) == 3:
         # ── JWT verification via JWKS ────────────────────────────────
-        jwks = get_jwks()
         unverified_header = jwt.get_unverified_header(token)
+        rsa_key = _signing_key(unverified_header.get("kid"))
 
-        rsa_key = {}
-        for key in jwks["keys"]:
-            if key["kid"] == unverified_header.get("kid"):
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n":   key["n"],
-                    "e":   key["e"],
-                }
-                break
-
-        if not rsa_key:
+        if rsa_key is None:
             raise JWTError("Unable to find appropriate signing key")
 
         return jwt.decode(
@@ -69,8 +129,7 @@ def verify_auth0_token(token: str) -> dict:
         )
 
     # ── Opaque token: validate via Auth0 /userinfo ───────────────────
-    import requests as _req
-    resp = _req.get(
+    resp = _auth0_http.get(
         f"https://{AUTH0_DOMAIN}/userinfo",
         headers={"Authorization": f"Bearer {token}"},
         timeout=5,
@@ -112,7 +171,8 @@ def get_auth0_user_info(token: str) -> dict:
         user_info = jwt.decode(
             token,
             options={"verify_signature": False},  # ID token is already verified
-            audience=AUTH0_CLIENT_ID
+            audience=AUTH0_CLIENT_ID,
+            algorithms=AUTH0_ALGORITHMS,
         )
         
         return {
@@ -196,8 +256,6 @@ def exchange_code_for_tokens(code: str) -> dict:
     Exchange authorization code for tokens.
     Returns access_token, id_token, and refresh_token.
     """
-    import requests
-    
     token_url = f"https://{AUTH0_DOMAIN}/oauth/token"
     token_data = {
         "grant_type": "authorization_code",
@@ -207,7 +265,7 @@ def exchange_code_for_tokens(code: str) -> dict:
         "redirect_uri": AUTH0_CALLBACK_URL
     }
     
-    response = requests.post(token_url, json=token_data)
+    response = _auth0_http.post(token_url, json=token_data, timeout=10)
     
     if response.status_code != 200:
         raise JWTError(f"Failed to exchange code for tokens: {response.text}")
@@ -0,0 +1,114 @@
+"""
+In-process TTL cache cho response của các endpoint dữ liệu public.
+
+Dữ liệu market (gold, silver, SBV, termdepo, global) chỉ đổi vài lần/ngày khi
+crawler ghi, nhưng mỗi request đều round-trip tới Neon rồi serialize lại. API
+chạy 1 worker (xem Dockerfile) nên dict + lock là đủ; khi scale lên multi-worker
+thì chuyển sang Redis với cùng get/set. Crawler chạy ở process khác nên không
+invalidate được — TTL (RESPONSE_CACHE_TTL, giây) là giới hạn độ trễ dữ liệu.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+from fastapi.responses import Response
+
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "300"))
+
+
+class TTLCache:
+    """Dict có hạn dùng + giới hạn số entry (bỏ entry cũ nhất khi đầy)."""
+
+    def __init__(self, ttl: float, maxsize: int = 512):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            if hit[0] <= now:
+                del self._data[key]
+                return None
+            return hit[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                for k in [k for k, (exp, _) in self._data.items() if exp <= now]:
+                    del self._data[k]
+                if len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]  # dict giữ thứ tự chèn
+            self._data[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_responses = TTLCache(RESPONSE_CACHE_TTL)
+
+
+def _etag(body: bytes) -> str:
+    # Weak: GZipMiddleware có thể nén body, byte trên dây khác body gốc
+    return 'W/"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _not_modified(request, etag: str) -> bool:
+    if request is None:
+        return False
+    if_none_match = request.headers.get("if-none-match", "")
+    return if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]
+
+
+def cached_response(fn):
+    """
+    Cache body của response 200 theo (endpoint, query params đã parse).
+    Đặt ngay trên `async def`, dưới `@router.get(...)`. Lỗi (HTTPException)
+    không bị cache.
+
+    Kèm ETag (hash body, tính 1 lần khi ghi cache) + Cache-Control private: client
+    gửi lại If-None-Match khớp thì nhận 304 rỗng thay vì tải lại cả mảng dữ liệu.
+    private vì các endpoint này gated theo API key — không cho CDN/proxy dùng chung.
+    """
+    sig = inspect.signature(fn)
+    cache_control = f"private, max-age={RESPONSE_CACHE_TTL}"
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if RESPONSE_CACHE_TTL <= 0:
+            return await fn(*args, **kwargs)
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        request = bound.arguments.get("request")
+        key = (fn.__name__, tuple(
+            (k, v) for k, v in bound.arguments.items() if k != "request"
+        ))
+        hit = _responses.get(key)
+        if hit is not None:
+            body, media_type, etag = hit
+            response = Response(content=body, media_type=media_type)
+        else:
+            response = await fn(*args, **kwargs)
+            if response.status_code != 200:
+                return response
+            etag = _etag(response.body)
+            _responses.set(key, (response.body, response.media_type, etag))
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return response
+    return wrapper
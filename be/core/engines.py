@@ -1,7 +1,12 @@
+import logging
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
 from fastapi import HTTPException
 
+logger = logging.getLogger(__name__)
+
 _engine_crawl = None
 _engine_global = None
 _engine_argus = None
@@ -9,7 +14,70 @@ _engine_user = None
 _engine_finstock = None
 _engine_corp = None
 
-_POOL_KWARGS = dict(pool_pre_ping=True, pool_size=3, max_overflow=5, pool_recycle=300)
+# pool_pre_ping costs a `SELECT 1` round trip to Neon on every checkout. It stays
+# on by default for the long-lived API process; set DB_PRE_PING=0 to drop it.
+_PRE_PING = os.getenv("DB_PRE_PING", "1") == "1"
+
+# LIFO checkout keeps reusing the few most recently returned connections, so the
+# rest of the pool idles out (pool_recycle) instead of every socket being touched
+# in turn — fewer fresh TCP+TLS handshakes to Neon under bursty traffic.
+_POOL_KWARGS = dict(
+    pool_pre_ping=_PRE_PING,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "3")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "5")),
+    pool_recycle=300,
+    pool_use_lifo=True,
+)
+
+# executemany batching (psycopg2 only — the psycopg v3 dialect pipelines on its
+# own and rejects these kwargs). INSERTs with a list of params are already sent
+# as multi-row VALUES pages by SQLAlchemy 2.0; values_plus_batch also folds
+# executemany UPDATE/DELETE into execute_batch pages instead of one RTT per row.
+_PSYCOPG2_BATCH_KWARGS = dict(
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+)
+
+
+# Per-connection caps so one runaway query or forgotten transaction cannot hold a
+# pool slot for minutes and starve every other request (0 = no limit). Sent once
+# per new physical connection in a single round trip; migrations and the boot DDL
+# build their own engines, so index builds are not capped.
+SESSION_SETTINGS = {
+    "statement_timeout": int(os.getenv("PG_STATEMENT_TIMEOUT_MS", "15000")),
+    "lock_timeout": int(os.getenv("PG_LOCK_TIMEOUT_MS", "3000")),
+    "idle_in_transaction_session_timeout": int(os.getenv("PG_IDLE_IN_TX_TIMEOUT_MS", "30000")),
+}
+_SET_SESSION_SQL = "; ".join(f"SET {name} = {value}" for name, value in SESSION_SETTINGS.items())
+
+# Long reads that hold one transaction open — COPY exports and server-side
+# cursors streamed to a (possibly slow) client — run this first in their
+# transaction: it lifts the statement and idle-in-transaction caps until commit or
+# rollback, so the pooled connection keeps them afterwards.
+UNCAP_TRANSACTION_SQL = "SET LOCAL statement_timeout = 0; SET LOCAL idle_in_transaction_session_timeout = 0"
+
+
+def _apply_session_settings(dbapi_connection, connection_record):
+    # Autocommit so the SETs are not undone by the pool's rollback-on-return
+    autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    try:
+        with dbapi_connection.cursor() as cur:
+            cur.execute(_SET_SESSION_SQL)
+    except Exception as e:
+        logger.warning(f"Could not apply session timeouts: {e}")
+    finally:
+        dbapi_connection.autocommit = autocommit
+
+
+def _create_engine(db_url):
+    kwargs = dict(_POOL_KWARGS)
+    if make_url(db_url).get_driver_name() == "psycopg2":
+        kwargs.update(_PSYCOPG2_BATCH_KWARGS)
+    engine = create_engine(db_url, **kwargs)
+    event.listen(engine, "connect", _apply_session_settings)
+    return engine
 
 
 def get_engine_user():
@@ -18,17 +86,29 @@ def get_engine_user():
         db_url = os.getenv("USER_DB")
         if not db_url:
             raise ValueError("USER_DB is not set — refusing to fall back to another database")
-        _engine_user = create_engine(db_url, **_POOL_KWARGS)
+        _engine_user = _create_engine(db_url)
     return _engine_user
 
 
+_session_user = None
+
+
+def get_session_user():
+    """New ORM Session on USER_DB. The sessionmaker is built once, on first use
+    like the engines, instead of per request."""
+    global _session_user
+    if _session_user is None:
+        _session_user = sessionmaker(bind=get_engine_user())
+    return _session_user()
+
+
 def get_engine_crawl():
     global _engine_crawl
     if _engine_crawl is None:
         db_url = os.getenv("CRAWLING_BOT_DB")
         if not db_url:
             raise HTTPException(status_code=500, detail="CRAWLING_BOT_DB not set")
-        _engine_crawl = create_engine(db_url, **_POOL_KWARGS)
+        _engine_crawl = _create_engine(db_url)
     return _engine_crawl
 
 
@@ -38,7 +118,7 @@ def get_engine_global():
         db_url = os.getenv("GLOBAL_INDICATOR_DB")
         if not db_url:
             raise HTTPException(status_code=500, detail="GLOBAL_INDICATOR_DB not set")
-        _engine_global = create_engine(db_url, **_POOL_KWARGS)
+        _engine_global = _create_engine(db_url)
     return _engine_global
 
 
@@ -48,7 +128,7 @@ def get_engine_argus():
         db_url = os.getenv("ARGUS_FINTEL_DB")
         if not db_url:
             raise HTTPException(status_code=500, detail="ARGUS_FINTEL_DB not set")
-        _engine_argus = create_engine(db_url, **_POOL_KWARGS)
+        _engine_argus = _create_engine(db_url)
     return _engine_argus
 
 
@@ -58,7 +138,7 @@ def get_engine_finstock():
         db_url = os.getenv("FINSTOCK_DB")
         if not db_url:
             raise HTTPException(status_code=500, detail="FINSTOCK_DB not set")
-        _engine_finstock = create_engine(db_url, **_POOL_KWARGS)
+        _engine_finstock = _create_engine(db_url)
     return _engine_finstock
 
 
@@ -69,7 +149,7 @@ def get_engine_corp():
         db_url = os.getenv("CRAWLING_CORP_DB")
         if not db_url:
             raise HTTPException(status_code=500, detail="CRAWLING_CORP_DB not set")
-        _engine_corp = create_engine(db_url, **_POOL_KWARGS)
+        _engine_corp = _create_engine(db_url)
     return _engine_corp
 
 
@@ -84,7 +164,7 @@ def get_engine_fuel():
         db_url = os.getenv("FUEL_FORECAST_DB")
         if not db_url:
             raise HTTPException(status_code=500, detail="FUEL_FORECAST_DB not set")
-        _engine_fuel = create_engine(db_url, **_POOL_KWARGS)
+        _engine_fuel = _create_engine(db_url)
     return _engine_fuel
 
 
@@ -98,5 +178,5 @@ def get_engine_knowledge():
         db_url = os.getenv("KNOWLEDGE_MARKET_DB")
         if not db_url:
             raise RuntimeError("KNOWLEDGE_MARKET_DB env var not set")
-        _engine_knowledge = create_engine(db_url, **_POOL_KWARGS)
+        _engine_knowledge = _create_engine(db_url)
     return _engine_knowledge
@@ -14,22 +14,23 @@ def migrate_crawl_db():
     db_url = os.getenv("CRAWLING_BOT_DB")
     if not db_url:
         return
+    columns = [
+        ("type",         "VARCHAR(20) NOT NULL DEFAULT 'USD'"),
+        ("source",       "VARCHAR(20) NOT NULL DEFAULT 'Crawl'"),
+        ("bank",         "VARCHAR(10) DEFAULT 'SBV'"),
+        ("buy_transfer", "FLOAT"),
+        ("buy_cash",     "FLOAT"),
+        ("sell_rate",    "FLOAT"),
+    ]
+    # Một câu ALTER TABLE với nhiều ADD COLUMN IF NOT EXISTS: 1 round trip + 1 commit
+    # thay vì 6 lần execute/commit mỗi lần boot (đã có cột thì là no-op).
+    ddl = "ALTER TABLE vn_macro_fxrate_daily " + ", ".join(
+        f"ADD COLUMN IF NOT EXISTS {col} {definition}" for col, definition in columns
+    )
     try:
-        eng = create_engine(db_url, pool_pre_ping=True)
-        with eng.connect() as conn:
-            for col, definition in [
-                ("type",         "VARCHAR(20) NOT NULL DEFAULT 'USD'"),
-                ("source",       "VARCHAR(20) NOT NULL DEFAULT 'Crawl'"),
-                ("bank",         "VARCHAR(10) DEFAULT 'SBV'"),
-                ("buy_transfer", "FLOAT"),
-                ("buy_cash",     "FLOAT"),
-                ("sell_rate",    "FLOAT"),
-            ]:
-                try:
-                    conn.execute(text(f"ALTER TABLE vn_macro_fxrate_daily ADD COLUMN IF NOT EXISTS {col} {definition}"))
-                    conn.commit()
-                except Exception:
-                    conn.rollback()
+        eng = create_engine(db_url)
+        with eng.begin() as conn:
+            conn.execute(text(ddl))
         eng.dispose()
     except Exception as e:
         logger.warning(f"[startup] crawl DB migration warning: {e}")
@@ -37,3 +38,15 @@ def migrate_crawl_db():
 # migrate_user_db() đã được thay thế bởi Alembic migration 001_initial_schema.
 # Schema của USER_DB (users, payment_orders, user_interest) được quản lý
 # hoàn toàn bởi: alembic upgrade head (chạy trong buildCommand của render.yaml).
+
+
+def warm_auth0_jwks():
+    """Fetch Auth0 JWKS once at boot so the first authenticated request does
+    not pay the HTTPS round trip. Non-fatal: keys are re-fetched on demand."""
+    if not os.getenv("AUTH0_DOMAIN"):
+        return
+    try:
+        from auth import get_signing_keys
+        get_signing_keys()
+    except Exception as e:
+        logger.warning(f"[startup] JWKS warm-up failed: {e}")
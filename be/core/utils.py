@@ -1,13 +1,30 @@
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 
+# 30d/90d: the Excel add-in sends these; 3m/6m/2y/3y: the shipped knowledge packs
+# (content/knowledge_packs/) call the API with them.
+_PERIOD_DAYS = {
+    "7d": 7, "1m": 30, "30d": 30, "3m": 90, "90d": 90, "6m": 180,
+    "1y": 365, "2y": 730, "3y": 1095,
+}
 
-def get_date_filter(period: str) -> str:
-    now = datetime.now()
-    if period == "7d":
-        return (now - timedelta(days=7)).strftime("%Y-%m-%d")
-    elif period == "1m":
-        return (now - timedelta(days=30)).strftime("%Y-%m-%d")
-    elif period == "1y":
-        return (now - timedelta(days=365)).strftime("%Y-%m-%d")
-    else:  # 'all'
+# Query(pattern=...) for `period` params: anything else is a 422 before any DB
+# work or cache entry.
+PERIOD_PATTERN = "^(" + "|".join([*_PERIOD_DAYS, "all"]) + ")$"
+PERIOD_DESCRIPTION = "Time period: " + ", ".join([*_PERIOD_DAYS, "all"])
+
+
+@lru_cache(maxsize=16)
+def _date_filter(period: str, today: date) -> str:
+    days = _PERIOD_DAYS.get(period)
+    if days is None:  # 'all'
         return "2000-01-01"
+    return (today - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def get_date_filter(period: str) -> str:
+    # Keyed on today's date, so the cached value rolls over at midnight; unknown
+    # periods collapse to 'all' before the lookup so they cannot churn the cache.
+    if period not in _PERIOD_DAYS:
+        period = "all"
+    return _date_filter(period, date.today())
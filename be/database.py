@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 from sqlalchemy import create_engine, text, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 import time
 import logging
@@ -38,13 +39,43 @@ if SCHEMA and SCHEMA.lower() != "public":
 else:
     _resolved_search_path = "public"
 
+# Per-connection query caps (ms, 0 = no limit); same env vars as core/engines.py
+_SESSION_SETTINGS = {
+    "statement_timeout": int(os.getenv("PG_STATEMENT_TIMEOUT_MS", "15000")),
+    "lock_timeout": int(os.getenv("PG_LOCK_TIMEOUT_MS", "3000")),
+    "idle_in_transaction_session_timeout": int(os.getenv("PG_IDLE_IN_TX_TIMEOUT_MS", "30000")),
+}
+
+# How search_path (and the caps above) reach each new backend:
+#   set     — one multi-statement SET on connect (default; one extra round trip per connection)
+#   startup — sent as `-c name=value` in the StartupMessage, zero extra round
+#             trips; needs a direct endpoint (Neon's -pooler / PgBouncer reject `options`)
+#   server  — already role defaults, nothing sent. One-time DBA commands:
+#             ALTER ROLE <app_user> IN DATABASE <db> SET search_path = <schema>, public;
+#             ALTER ROLE <app_user> IN DATABASE <db> SET statement_timeout = '15s';  (etc.)
+SEARCH_PATH_MODE = os.getenv("DB_SEARCH_PATH_MODE", "set").strip().lower()
+_startup_options = (
+    {"options": " ".join(
+        [f"-c search_path={_resolved_search_path}"]
+        + [f"-c {name}={value}" for name, value in _SESSION_SETTINGS.items()]
+    )} if SEARCH_PATH_MODE == "startup" else {}
+)
+
+# executemany batching for psycopg2 (see core/engines.py); psycopg v3 rejects these
+_batch_kwargs = dict(
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+) if make_url(raw_url).get_driver_name() == "psycopg2" else {}
+
 engine = create_engine(
     raw_url,
     pool_size=int(os.getenv("SQLALCHEMY_POOL_SIZE", "5")),
     max_overflow=int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", "10")),
     pool_timeout=int(os.getenv("SQLALCHEMY_POOL_TIMEOUT", "10")),
     pool_recycle=int(os.getenv("SQLALCHEMY_POOL_RECYCLE", "300")),
-    pool_pre_ping=True,
+    pool_pre_ping=(os.getenv("DB_PRE_PING", "1") == "1"),
+    pool_use_lifo=True,  # reuse the warmest connections; see core/engines.py
     connect_args={
         # Keep connection alive at TCP level (psycopg2)
         "keepalives": 1,
@@ -52,9 +83,11 @@ engine = create_engine(
         "keepalives_interval": int(os.getenv("PG_KEEPALIVES_INTERVAL", "10")),
         "keepalives_count": int(os.getenv("PG_KEEPALIVES_COUNT", "5")),
         "connect_timeout": int(os.getenv("PG_CONNECT_TIMEOUT", "10")),
+        **_startup_options,
     },
     echo=(os.getenv("SQLALCHEMY_ECHO", "false").lower() == "true"),
     future=True,
+    **_batch_kwargs,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -67,17 +100,28 @@ def get_db():
         db.close()
 
 logger = logging.getLogger("datanlanh")
-logger.info(f"Using PostgreSQL search_path: {_resolved_search_path}")
+logger.info(f"Using PostgreSQL search_path: {_resolved_search_path} ({SEARCH_PATH_MODE})")
 
-# search_path
-@event.listens_for(engine, "connect")
-def _set_search_path(dbapi_connection, connection_record):
-    try:
-        cur = dbapi_connection.cursor()
-        cur.execute(f"SET search_path TO {_resolved_search_path}")
-        cur.close()
-    except Exception as e:
-        logger.warning(f"Could not set search_path: {e}")
+# search_path + query caps
+if SEARCH_PATH_MODE == "set":
+    _SET_SESSION_SQL = "; ".join(
+        [f"SET search_path TO {_resolved_search_path}"]
+        + [f"SET {name} = {value}" for name, value in _SESSION_SETTINGS.items()]
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_search_path(dbapi_connection, connection_record):
+        # Autocommit so the SETs are not undone by the pool's rollback-on-return
+        autocommit = dbapi_connection.autocommit
+        try:
+            dbapi_connection.autocommit = True
+            cur = dbapi_connection.cursor()
+            cur.execute(_SET_SESSION_SQL)
+            cur.close()
+        except Exception as e:
+            logger.warning(f"Could not set search_path: {e}")
+        finally:
+            dbapi_connection.autocommit = autocommit
 
 # Ensure schema exists if not using public
 try:
@@ -87,14 +131,16 @@ try:
 except Exception as _e:
     logger.warning(f"Could not ensure schema '{SCHEMA}': {_e}")
 
-# Query logging (optional, keep if you want performance monitoring)
-@event.listens_for(engine, "before_cursor_execute")
-def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    conn.info.setdefault('query_start_time', []).append(time.time())
-    logger.debug(f"Query Start: {statement[:100]}...")
-
-@event.listens_for(engine, "after_cursor_execute")
-def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    total = time.time() - conn.info['query_start_time'].pop(-1)
-    if total > 1.0:
-        logger.warning(f"SLOW QUERY ({total:.3f}s): {statement[:200]}")
\ No newline at end of file
+# Query logging — only when SQLALCHEMY_TRACE=1; otherwise no listener runs per statement
+if os.getenv("SQLALCHEMY_TRACE", "0") == "1":
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query Start: %s...", statement[:100])
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        total = time.perf_counter() - conn.info['query_start_time'].pop(-1)
+        if total > 1.0:
+            logger.warning("SLOW QUERY (%.3fs): %s", total, statement[:200])
@@ -1,18 +1,32 @@
 """
 Viet Dataverse API Router
 Provides CSV download endpoints for research datasets
+
+Not mounted: main.py does not include this router, so /api/dataverse/* is
+unreachable and the gzip export cache below only runs via `python dataverse.py`.
+Before mounting, gate it like /api/v1/vn30: VN30FSBS is premium data there.
 """
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Session
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import ArgumentError
 from sqlalchemy.pool import NullPool
-import pandas as pd
-import io
-from datetime import datetime
+import glob
+import gzip
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from functools import lru_cache
 import logging
 import os
+import re
+
+from core.cache import TTLCache
+from core.engines import UNCAP_TRANSACTION_SQL, get_engine_crawl
 
 # Initialize router
 router = APIRouter(prefix="/api/dataverse", tags=["dataverse"])
@@ -22,8 +36,34 @@ CRAWLING_BOT_DB = os.getenv("CRAWLING_BOT_DB")
 if not CRAWLING_BOT_DB:
     raise RuntimeError("CRAWLING_BOT_DB is required")
 
-# Use NullPool to avoid connection state issues
-engine = create_engine(CRAWLING_BOT_DB, poolclass=NullPool)
+# Validate once at import so a malformed URL fails at startup, not on the first
+# download (never echo the URL — it carries credentials)
+try:
+    _crawl_url = make_url(CRAWLING_BOT_DB)
+except ArgumentError:
+    raise RuntimeError("CRAWLING_BOT_DB is not a valid database URL") from None
+if (_crawl_url.host or "").endswith(".neon.tech"):
+    if "-pooler" not in _crawl_url.host:
+        logging.warning("CRAWLING_BOT_DB uses a direct Neon endpoint; the -pooler host spares Neon's connection limit")
+    if _crawl_url.query.get("sslmode") not in ("require", "verify-ca", "verify-full"):
+        logging.warning("CRAWLING_BOT_DB has no sslmode=require; Neon rejects non-TLS connections")
+
+# Share the pooled CRAWLING_BOT_DB engine with the rest of the API — this module
+# sets no session state, so pooled connections are safe and each request skips
+# the TCP+TLS+auth handshake to Neon. DATAVERSE_POOL=null restores NullPool.
+if os.getenv("DATAVERSE_POOL", "shared") == "null":
+    engine = create_engine(CRAWLING_BOT_DB, poolclass=NullPool)
+else:
+    engine = get_engine_crawl()
+
+# Datasets change at most daily, so each CSV is exported once into a gzip file
+# and served from disk until the data version moves (see _data_version) or it is
+# older than DATAVERSE_CSV_MAX_AGE (seconds).
+# `python dataverse.py` refreshes all of them (cron); requests rebuild lazily.
+DATAVERSE_CACHE_DIR = os.getenv("DATAVERSE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "dataverse"))
+DATAVERSE_CSV_MAX_AGE = int(os.getenv("DATAVERSE_CSV_MAX_AGE", "86400"))
+CSV_CHUNK_BYTES = 64 * 1024
+_materialize_lock = threading.Lock()
 
 # Dataset configuration
 DATASET_CONFIG = {
@@ -47,7 +87,9 @@ DATASET_CONFIG = {
     },
     'VNTermDeposit': {
         'table': 'vn_macro_termdepo_daily',
-        'query': 'SELECT bank_code, date, term_1m, term_6m, term_12m, term_24m FROM vn_macro_termdepo_daily ORDER BY date DESC',
+        # Latest crawl per (date, bank) — the crawler may write a day more than once
+        'query': 'SELECT DISTINCT ON (date, bank_code) bank_code, date, term_1m, term_6m, term_12m, term_24m '
+                 'FROM vn_macro_termdepo_daily ORDER BY date DESC, bank_code, crawl_time DESC',
         'filename': 'vn_term_deposit_rates.csv',
         'description': 'Vietnamese Term Deposit Rates'
     },
@@ -65,35 +107,217 @@ DATASET_CONFIG = {
     }
 }
 
+# Table names are interpolated into SQL below, so they must be plain identifiers
+for _key, _config in DATASET_CONFIG.items():
+    if not re.fullmatch(r"[a-z_][a-z0-9_]*", _config['table']):
+        raise RuntimeError(f"DATASET_CONFIG[{_key!r}] has an invalid table name")
+
+# Statements built once at import instead of per request
+COUNT_STMTS = {k: text(f"SELECT COUNT(*) FROM {c['table']}") for k, c in DATASET_CONFIG.items()}
+PREVIEW_STMTS = {k: text(c['query'] + ' LIMIT :lim') for k, c in DATASET_CONFIG.items()}
+
+
+# Planner row estimates are refreshed by autovacuum/ANALYZE, so a minute of
+# staleness costs nothing and saves the catalog round trip on every listing
+_ROW_ESTIMATES_TTL = 60
+_row_estimates = TTLCache(_ROW_ESTIMATES_TTL, maxsize=1)
+
+_SELECT_ROW_ESTIMATES = text(
+    "SELECT relname, reltuples::bigint FROM pg_class "
+    "WHERE relname = ANY(:tables) AND relkind IN ('r', 'p', 'm')"
+)
+
+
+@lru_cache(maxsize=None)
+def _count_union(tables: tuple):
+    # Table names come from DATASET_CONFIG (validated above), never from the request
+    return text(" UNION ALL ".join(f"SELECT '{t}', COUNT(*) FROM {t}" for t in tables))
+
+
+def _row_counts(exact: bool = False) -> dict:
+    """
+    {table: row count} for every dataset table that exists. Planner estimates
+    come from one pg_class query; tables needing an exact count (requested, or
+    never analyzed so reltuples = -1) are counted in a single UNION ALL on the
+    same connection. Missing tables are simply absent from the result.
+    """
+    tables = list(dict.fromkeys(c['table'] for c in DATASET_CONFIG.values()))
+    counts = _row_estimates.get("all")
+    if counts is not None and not exact and all(counts.get(t, 0) >= 0 for t in tables):
+        return counts
+    with engine.connect() as conn:
+        if counts is None:
+            counts = dict(conn.execute(_SELECT_ROW_ESTIMATES, {'tables': tables}).all())
+            _row_estimates.set("all", counts)
+        to_count = [t for t in tables if t in counts and (exact or counts[t] < 0)]
+        if not to_count:
+            return counts
+        return {**counts, **dict(conn.execute(_count_union(tuple(to_count))).all())}
+
+
+# Data version = newest crawl_time in the table (epoch seconds). It is the ETag
+# for previews/downloads and names the export file, so a new crawl produces a
+# new export on the next download instead of waiting for DATAVERSE_CSV_MAX_AGE.
+# Tables without crawl_time get None: no ETag, age-based refresh only.
+_DATA_VERSION_TTL = 30
+_data_versions = TTLCache(_DATA_VERSION_TTL, maxsize=len(DATASET_CONFIG))
+VERSION_STMTS = {
+    k: text(f"SELECT EXTRACT(EPOCH FROM MAX(crawl_time))::bigint FROM {c['table']}")
+    for k, c in DATASET_CONFIG.items()
+}
+HTTP_CACHE_CONTROL = "public, max-age=300"
+
+
+def _data_version(dataset_name: str):
+    hit = _data_versions.get(dataset_name)
+    if hit is None:
+        try:
+            with engine.connect() as conn:
+                version = conn.execute(VERSION_STMTS[dataset_name]).scalar()
+        except Exception as e:
+            logging.debug(f"No data version for {dataset_name}: {e}")
+            version = None
+        hit = (version,)
+        _data_versions.set(dataset_name, hit)
+    return hit[0]
+
+
+def _etag(version):
+    return f'W/"{version}"' if version is not None else None
+
+
+def _not_modified(request: Request, etag) -> bool:
+    if etag is None:
+        return False
+    if_none_match = request.headers.get("if-none-match", "")
+    return if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]
+
+
+def _csv_path(dataset_name: str, version=None) -> str:
+    suffix = f".{version}" if version is not None else ""
+    return os.path.join(DATAVERSE_CACHE_DIR, f"{dataset_name}{suffix}.csv.gz")
+
+
+def _prune_exports(dataset_name: str, keep: str):
+    """Drop superseded exports, keeping `keep` and the one before it (it may still be streaming)."""
+    others = sorted(
+        (p for p in glob.glob(os.path.join(DATAVERSE_CACHE_DIR, f"{dataset_name}.*csv.gz")) if p != keep),
+        key=os.path.getmtime,
+    )
+    for old in others[:-1]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+
+def materialize_dataset(dataset_name: str, version=None) -> bool:
+    """
+    Export one dataset with `COPY (<query>) TO STDOUT WITH CSV HEADER` straight
+    into `<DATAVERSE_CACHE_DIR>/<name>[.<version>].csv.gz`. The file is written
+    under a temp name and renamed, so readers never see a partial export.
+    Returns False (and leaves no file) when the query returns no rows.
+    """
+    config = DATASET_CONFIG[dataset_name]
+    path = _csv_path(dataset_name, version)
+    os.makedirs(DATAVERSE_CACHE_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=DATAVERSE_CACHE_DIR, suffix=".tmp")
+    try:
+        raw = engine.raw_connection()
+        try:
+            with os.fdopen(fd, "wb") as f, gzip.GzipFile(fileobj=f, mode="wb", compresslevel=6) as gz:
+                with raw.cursor() as cur:
+                    # Full-table exports outlive the API's per-connection caps
+                    cur.execute(UNCAP_TRANSACTION_SQL)
+                    cur.copy_expert(f"COPY ({config['query']}) TO STDOUT WITH (FORMAT CSV, HEADER TRUE)", gz)
+            raw.commit()
+        finally:
+            raw.close()
+        with gzip.open(tmp, "rb") as gz:
+            gz.readline()  # header
+            has_rows = bool(gz.read(1))
+        if not has_rows:
+            os.remove(tmp)
+            if os.path.exists(path):
+                os.remove(path)
+            return False
+        os.replace(tmp, path)
+        _prune_exports(dataset_name, keep=path)
+        return True
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _fresh_csv(dataset_name: str, version=None):
+    """Path of an up-to-date gzip export, rebuilding it if stale; None if empty."""
+    path = _csv_path(dataset_name, version)
+
+    def is_fresh():
+        return os.path.exists(path) and time.time() - os.path.getmtime(path) < DATAVERSE_CSV_MAX_AGE
+
+    if not is_fresh():
+        with _materialize_lock:
+            # Another request may have rebuilt it while we waited
+            if not is_fresh() and not materialize_dataset(dataset_name, version):
+                return None
+    return path
+
+
+def _preview_rows(dataset_name: str, limit: int):
+    """(columns, first `limit` rows as mappings, total row count) on one connection."""
+    with engine.connect() as conn:
+        result = conn.execute(PREVIEW_STMTS[dataset_name], {'lim': limit})
+        columns = list(result.keys())
+        rows = result.mappings().all()
+        if not rows:
+            return columns, rows, 0
+        total_count = conn.execute(COUNT_STMTS[dataset_name]).scalar()
+    return columns, rows, total_count
+
+
+def _iter_file(f):
+    try:
+        while chunk := f.read(CSV_CHUNK_BYTES):
+            yield chunk
+    finally:
+        f.close()
+
 
 @router.get("/datasets")
-async def list_datasets():
+async def list_datasets(exact: bool = False):
     """
     List all available datasets with metadata
 
+    Args:
+        exact: Run COUNT(*) per table instead of using planner estimates
+
     Returns:
         JSON with list of datasets including record counts and availability
     """
-    datasets = []
+    try:
+        counts = await run_in_threadpool(_row_counts, exact)
+        probe_error = None
+    except Exception as e:
+        logging.warning(f"Dataset probe failed: {e}")
+        counts, probe_error = {}, str(e)
 
+    datasets = []
     for key, config in DATASET_CONFIG.items():
-        try:
-            # Get row count for each dataset
-            with engine.connect() as conn:
-                result = conn.execute(text(f"SELECT COUNT(*) FROM {config['table']}"))
-                count = result.scalar()
-
+        if config['table'] in counts:
             datasets.append({
                 'id': key,
                 'name': key,
                 'description': config['description'],
                 'filename': config['filename'],
-                'record_count': count,
+                'record_count': counts[config['table']],
                 'available': True
             })
-        except Exception as e:
+        else:
             # If table doesn't exist, mark as unavailable
-            logging.warning(f"Dataset {key} not available: {e}")
+            error = probe_error or f"table {config['table']} does not exist"
+            logging.warning(f"Dataset {key} not available: {error}")
             datasets.append({
                 'id': key,
                 'name': key,
@@ -101,14 +325,14 @@ async def list_datasets():
                 'filename': config['filename'],
                 'record_count': 0,
                 'available': False,
-                'error': str(e)
+                'error': error
             })
 
     return {'datasets': datasets}
 
 
 @router.get("/download/{dataset_name}")
-async def download_csv(dataset_name: str):
+async def download_csv(dataset_name: str, request: Request):
     """
     Download dataset as CSV file
 
@@ -116,7 +340,7 @@ async def download_csv(dataset_name: str):
         dataset_name: Name of the dataset (e.g., 'VNGold', 'VNSilver')
 
     Returns:
-        CSV file download
+        CSV file download (gzip-encoded when the client accepts it)
     """
 
     if dataset_name not in DATASET_CONFIG:
@@ -128,31 +352,43 @@ async def download_csv(dataset_name: str):
     config = DATASET_CONFIG[dataset_name]
 
     try:
-        # Query database
-        df = pd.read_sql(config['query'], engine)
+        version = await run_in_threadpool(_data_version, dataset_name)
+        etag = _etag(version)
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL})
 
-        if df.empty:
+        path = await run_in_threadpool(_fresh_csv, dataset_name, version)
+
+        if path is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No data found for dataset '{dataset_name}'"
             )
 
-        # Convert DataFrame to CSV
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        csv_buffer.seek(0)
-
         # Generate filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d')
         filename = f"{config['filename'].replace('.csv', '')}_{timestamp}.csv"
+        headers = {
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Vary": "Accept-Encoding",
+            "Cache-Control": HTTP_CACHE_CONTROL,
+        }
+        if etag:
+            headers["ETag"] = etag
+
+        # Serve the pre-compressed export as-is; FileResponse adds Last-Modified
+        # (and an mtime ETag when the table has no crawl_time)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return FileResponse(
+                path,
+                media_type="text/csv",
+                headers={**headers, "Content-Encoding": "gzip"}
+            )
 
-        # Return as streaming response
         return StreamingResponse(
-            iter([csv_buffer.getvalue()]),
+            _iter_file(gzip.open(path, "rb")),
             media_type="text/csv",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
-            }
+            headers=headers
         )
 
     except HTTPException:
@@ -166,7 +402,7 @@ async def download_csv(dataset_name: str):
 
 
 @router.get("/preview/{dataset_name}")
-async def preview_data(dataset_name: str, limit: int = 10):
+async def preview_data(dataset_name: str, request: Request, response: Response, limit: int = 10):
     """
     Preview first N rows of a dataset
 
@@ -190,30 +426,28 @@ async def preview_data(dataset_name: str, limit: int = 10):
     config = DATASET_CONFIG[dataset_name]
 
     try:
-        # Query database with limit
-        query = config['query'] + f' LIMIT {limit}'
-        df = pd.read_sql(query, engine)
+        version = await run_in_threadpool(_data_version, dataset_name)
+        etag = _etag(version)
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL})
 
-        if df.empty:
+        columns, rows, total_count = await run_in_threadpool(_preview_rows, dataset_name, limit)
+
+        if not rows:
             raise HTTPException(
                 status_code=404,
                 detail=f"No data found for dataset '{dataset_name}'"
             )
 
-        # Get total count
-        with engine.connect() as conn:
-            result = conn.execute(text(f"SELECT COUNT(*) FROM {config['table']}"))
-            total_count = result.scalar()
-
-        # Convert DataFrame to JSON-serializable format
-        # Handle datetime objects by converting to string
-        data = df.to_dict(orient='records')
-        for record in data:
-            for key, value in record.items():
-                if pd.isna(value):
-                    record[key] = None
-                elif isinstance(value, (pd.Timestamp, datetime)):
-                    record[key] = value.strftime('%Y-%m-%d')
+        # NULL comes back as None; only dates need converting to string
+        data = [
+            {k: (v.strftime('%Y-%m-%d') if isinstance(v, (datetime, date)) else v) for k, v in r.items()}
+            for r in rows
+        ]
+
+        response.headers["Cache-Control"] = HTTP_CACHE_CONTROL
+        if etag:
+            response.headers["ETag"] = etag
 
         return {
             'dataset': dataset_name,
@@ -221,7 +455,7 @@ async def preview_data(dataset_name: str, limit: int = 10):
             'total_records': total_count,
             'preview_records': len(data),
             'data': data,
-            'columns': list(df.columns)
+            'columns': columns
         }
 
     except HTTPException:
@@ -232,3 +466,14 @@ async def preview_data(dataset_name: str, limit: int = 10):
             status_code=500,
             detail=f"Failed to preview dataset: {str(e)}"
         )
+
+
+if __name__ == "__main__":
+    # Cron entry point: refresh every dataset export
+    logging.basicConfig(level=logging.INFO)
+    for name in DATASET_CONFIG:
+        try:
+            ok = materialize_dataset(name, _data_version(name))
+            logging.info(f"{name}: {'exported' if ok else 'empty, skipped'}")
+        except Exception as e:
+            logging.error(f"{name}: export failed: {e}")
@@ -6,10 +6,12 @@ These files are served via GitHub Pages for instant loading.
 Run after each crawler completes to update the static data.
 """
 
-import json
 import os
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+import orjson
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
 
@@ -47,15 +49,40 @@ def get_date_filter(period):
     return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
 
 
+# Periods written for every series. Each generator reads the widest window once
+# and slices the shorter ones out of it in Python (one round trip per table
+# instead of one per type/bank x period).
+SERIES_PERIODS = ['7d', '1m', '1y']
+WIDEST_PERIOD = '1y'
+
+
+# Series queries return one row per series with its columns already built by
+# Postgres: array_agg(... ORDER BY date) over the DISTINCT ON rows, dates as
+# to_char(date::date, 'YYYY-MM-DD') and numbers as float8 (COALESCE(x, 0) for
+# the `float(x) if x else 0` columns, NULLIF(x, 0) for the nullable ones).
+def _slice_since(columns, period):
+    """
+    Cut [dates, *values] (dates ascending, 'YYYY-MM-DD') down to the period —
+    the same points a `WHERE date >= '<get_date_filter(period)>'` query returns.
+    """
+    start = bisect_left(columns[0], get_date_filter(period))
+    return [col[start:] for col in columns]
+
+
+def _columns(row):
+    """Arrays of an aggregate row; array_agg over no rows gives NULL, not []."""
+    return [list(col or []) for col in row]
+
+
 def save_json(filename, data):
     """Save data to JSON file with metadata."""
     output = {
-        'generated_at': datetime.now().isoformat(),
+        'generated_at': datetime.now(),
         'data': data
     }
     filepath = STATIC_DIR / filename
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, separators=(',', ':'))
+    # orjson: compact UTF-8 (non-ASCII kept as-is), datetimes as ISO 8601
+    filepath.write_bytes(orjson.dumps(output))
     print(f"  Saved: {filepath.name} ({filepath.stat().st_size:,} bytes)")
 
 
@@ -79,36 +106,37 @@ def generate_gold_data():
 
     # FE prefetches "DOJI HN" as the default gold chart (app.js) — must always
     # be generated even if it falls outside the top-5 alphabetical types.
-    types_to_generate = list(dict.fromkeys(['DOJI HN'] + gold_types[:5]))
+    types_to_generate = [t for t in dict.fromkeys(['DOJI HN'] + gold_types[:5]) if t in gold_types]
+
+    with engine_crawl.connect() as conn:
+        result = conn.execute(text("""
+            SELECT type,
+                   array_agg(to_char(date::date, 'YYYY-MM-DD') ORDER BY date),
+                   array_agg(COALESCE(buy_price, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(sell_price, 0)::float8 ORDER BY date)
+            FROM (
+                SELECT DISTINCT ON (type, date) type, date, buy_price, sell_price
+                FROM vn_macro_gold_daily
+                WHERE date >= :since
+                AND type = ANY(:types)
+                ORDER BY type, date, crawl_time DESC
+            ) s
+            GROUP BY type
+        """), {'since': get_date_filter(WIDEST_PERIOD), 'types': types_to_generate})
+        by_type = {row[0]: _columns(row[1:]) for row in result}
 
     # Generate for each type and period
     for gold_type in types_to_generate:
-        if gold_type not in gold_types:
-            continue
-        for period in ['7d', '1m', '1y']:
-            date_filter = get_date_filter(period)
-
-            with engine_crawl.connect() as conn:
-                result = conn.execute(text(f"""
-                    SELECT date, buy_price, sell_price
-                    FROM (
-                        SELECT DISTINCT ON (date) date, buy_price, sell_price, crawl_time
-                        FROM vn_macro_gold_daily
-                        WHERE date >= '{date_filter}'
-                        AND type = :gold_type
-                        ORDER BY date, crawl_time DESC
-                    ) subquery
-                    ORDER BY date ASC
-                """), {'gold_type': gold_type})
-                rows = result.fetchall()
+        for period in SERIES_PERIODS:
+            dates, buy, sell = _slice_since(by_type.get(gold_type, [[], [], []]), period)
 
             data = {
                 'type': gold_type,
                 'period': period,
-                'count': len(rows),
-                'dates': [row[0].strftime('%Y-%m-%d') for row in rows],
-                'buy_prices': [float(row[1]) if row[1] else 0 for row in rows],
-                'sell_prices': [float(row[2]) if row[2] else 0 for row in rows]
+                'count': len(dates),
+                'dates': dates,
+                'buy_prices': buy,
+                'sell_prices': sell
             }
 
             # Sanitize filename
@@ -126,28 +154,29 @@ def generate_silver_data():
     """Generate static JSON for silver prices."""
     print("\n--- Generating Silver Data ---")
 
-    for period in ['7d', '1m', '1y']:
-        date_filter = get_date_filter(period)
-
-        with engine_crawl.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT date, buy_price, sell_price
-                FROM (
-                    SELECT DISTINCT ON (date) date, buy_price, sell_price, crawl_time
-                    FROM vn_macro_silver_daily
-                    WHERE date >= '{date_filter}'
-                    ORDER BY date, crawl_time DESC
-                ) subquery
-                ORDER BY date ASC
-            """))
-            rows = result.fetchall()
+    with engine_crawl.connect() as conn:
+        result = conn.execute(text("""
+            SELECT array_agg(to_char(date::date, 'YYYY-MM-DD') ORDER BY date),
+                   array_agg(COALESCE(buy_price, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(sell_price, 0)::float8 ORDER BY date)
+            FROM (
+                SELECT DISTINCT ON (date) date, buy_price, sell_price
+                FROM vn_macro_silver_daily
+                WHERE date >= :since
+                ORDER BY date, crawl_time DESC
+            ) s
+        """), {'since': get_date_filter(WIDEST_PERIOD)})
+        series = _columns(result.one())
+
+    for period in SERIES_PERIODS:
+        dates, buy, sell = _slice_since(series, period)
 
         data = {
             'period': period,
-            'count': len(rows),
-            'dates': [row[0].strftime('%Y-%m-%d') for row in rows],
-            'buy_prices': [float(row[1]) if row[1] else 0 for row in rows],
-            'sell_prices': [float(row[2]) if row[2] else 0 for row in rows]
+            'count': len(dates),
+            'dates': dates,
+            'buy_prices': buy,
+            'sell_prices': sell
         }
 
         save_json(f'silver_{period}.json', data)
@@ -160,23 +189,23 @@ def generate_vnindex_data():
     """Generate static JSON for VNIndex daily close."""
     print("\n--- Generating VNIndex Data ---")
 
-    for period in ['7d', '1m', '1y']:
-        date_filter = get_date_filter(period)
+    with engine_crawl.connect() as conn:
+        result = conn.execute(text("""
+            SELECT array_agg(to_char(date::date, 'YYYY-MM-DD') ORDER BY date),
+                   array_agg(COALESCE(close, 0)::float8 ORDER BY date)
+            FROM vn_macro_vnindex_daily
+            WHERE date >= :since
+        """), {'since': get_date_filter(WIDEST_PERIOD)})
+        series = _columns(result.one())
 
-        with engine_crawl.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT date, close
-                FROM vn_macro_vnindex_daily
-                WHERE date >= '{date_filter}'
-                ORDER BY date ASC
-            """))
-            rows = result.fetchall()
+    for period in SERIES_PERIODS:
+        dates, close = _slice_since(series, period)
 
         data = {
             'period': period,
-            'count': len(rows),
-            'dates': [row[0].strftime('%Y-%m-%d') for row in rows],
-            'close': [float(row[1]) if row[1] else 0 for row in rows]
+            'count': len(dates),
+            'dates': dates,
+            'close': close
         }
 
         save_json(f'vnindex_{period}.json', data)
@@ -189,32 +218,36 @@ def generate_sbv_data():
     """Generate static JSON for SBV interbank rates."""
     print("\n--- Generating SBV Interbank Data ---")
 
-    for period in ['7d', '1m', '1y']:
-        date_filter = get_date_filter(period)
-
-        with engine_crawl.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT date, ls_quadem, ls_1m, ls_3m, rediscount_rate, refinancing_rate
-                FROM (
-                    SELECT DISTINCT ON (date) date, ls_quadem, ls_1m, ls_3m,
-                           rediscount_rate, refinancing_rate, crawl_time
-                    FROM vn_macro_sbv_rate_daily
-                    WHERE date >= '{date_filter}'
-                    ORDER BY date, crawl_time DESC
-                ) subquery
-                ORDER BY date ASC
-            """))
-            rows = result.fetchall()
+    with engine_crawl.connect() as conn:
+        result = conn.execute(text("""
+            SELECT array_agg(to_char(date::date, 'YYYY-MM-DD') ORDER BY date),
+                   array_agg(COALESCE(ls_quadem, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(ls_1m, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(ls_3m, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(rediscount_rate, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(refinancing_rate, 0)::float8 ORDER BY date)
+            FROM (
+                SELECT DISTINCT ON (date) date, ls_quadem, ls_1m, ls_3m,
+                       rediscount_rate, refinancing_rate
+                FROM vn_macro_sbv_rate_daily
+                WHERE date >= :since
+                ORDER BY date, crawl_time DESC
+            ) s
+        """), {'since': get_date_filter(WIDEST_PERIOD)})
+        series = _columns(result.one())
+
+    for period in SERIES_PERIODS:
+        dates, overnight, m1, m3, rediscount, refinancing = _slice_since(series, period)
 
         data = {
             'period': period,
-            'count': len(rows),
-            'dates': [row[0].strftime('%Y-%m-%d') for row in rows],
-            'overnight': [float(row[1]) if row[1] else 0 for row in rows],
-            'month_1': [float(row[2]) if row[2] else 0 for row in rows],
-            'month_3': [float(row[3]) if row[3] else 0 for row in rows],
-            'rediscount': [float(row[4]) if row[4] else 0 for row in rows],
-            'refinancing': [float(row[5]) if row[5] else 0 for row in rows]
+            'count': len(dates),
+            'dates': dates,
+            'overnight': overnight,
+            'month_1': m1,
+            'month_3': m3,
+            'rediscount': rediscount,
+            'refinancing': refinancing
         }
 
         save_json(f'sbv_{period}.json', data)
@@ -238,34 +271,40 @@ def generate_termdepo_data():
 
     print(f"  Banks: {banks}")
 
+    with engine_crawl.connect() as conn:
+        result = conn.execute(text("""
+            SELECT bank_code,
+                   array_agg(to_char(date::date, 'YYYY-MM-DD') ORDER BY date),
+                   array_agg(COALESCE(term_1m, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(term_3m, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(term_6m, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(term_12m, 0)::float8 ORDER BY date),
+                   array_agg(COALESCE(term_24m, 0)::float8 ORDER BY date)
+            FROM (
+                SELECT DISTINCT ON (bank_code, date) bank_code, date, term_1m, term_3m, term_6m, term_12m, term_24m
+                FROM vn_macro_termdepo_daily
+                WHERE date >= :since
+                AND bank_code IS NOT NULL
+                ORDER BY bank_code, date, crawl_time DESC
+            ) s
+            GROUP BY bank_code
+        """), {'since': get_date_filter(WIDEST_PERIOD)})
+        by_bank = {row[0]: _columns(row[1:]) for row in result}
+
     for bank in banks:
-        for period in ['7d', '1m', '1y']:
-            date_filter = get_date_filter(period)
-
-            with engine_crawl.connect() as conn:
-                result = conn.execute(text(f"""
-                    SELECT date, term_1m, term_3m, term_6m, term_12m, term_24m
-                    FROM (
-                        SELECT DISTINCT ON (date) date, term_1m, term_3m, term_6m, term_12m, term_24m, crawl_time
-                        FROM vn_macro_termdepo_daily
-                        WHERE date >= '{date_filter}'
-                        AND bank_code = :bank
-                        ORDER BY date, crawl_time DESC
-                    ) subquery
-                    ORDER BY date ASC
-                """), {'bank': bank})
-                rows = result.fetchall()
+        for period in SERIES_PERIODS:
+            dates, t1, t3, t6, t12, t24 = _slice_since(by_bank.get(bank, [[]] * 6), period)
 
             data = {
                 'bank': bank,
                 'period': period,
-                'count': len(rows),
-                'dates': [row[0].strftime('%Y-%m-%d') for row in rows],
-                'term_1m': [float(row[1]) if row[1] else 0 for row in rows],
-                'term_3m': [float(row[2]) if row[2] else 0 for row in rows],
-                'term_6m': [float(row[3]) if row[3] else 0 for row in rows],
-                'term_12m': [float(row[4]) if row[4] else 0 for row in rows],
-                'term_24m': [float(row[5]) if row[5] else 0 for row in rows]
+                'count': len(dates),
+                'dates': dates,
+                'term_1m': t1,
+                'term_3m': t3,
+                'term_6m': t6,
+                'term_12m': t12,
+                'term_24m': t24
             }
 
             save_json(f'termdepo_{bank}_{period}.json', data)
@@ -309,7 +348,7 @@ def generate_market_pulse_data():
                 'url': row[5],
                 'label': row[6],
                 'mri': row[7],
-                'generated_at': row[8].isoformat() if row[8] else None,
+                'generated_at': row[8],
                 'lang': row[9]
             })
 
@@ -327,22 +366,20 @@ def generate_fxrate_data():
     """Generate static JSON for exchange rates (USD/VND from VCB by default)."""
     print("\n--- Generating Exchange Rate Data ---")
 
-    # Ensure columns exist (table may have been created by older schema)
+    # Ensure columns exist (table may have been created by older schema).
+    # One fixed statement, same as core/startup.migrate_crawl_db: no SQL built
+    # from Python values, one round trip, no-op once the columns exist.
     try:
-        with engine_crawl.connect() as conn:
-            for col, definition in [
-                ('type',         "VARCHAR(20) NOT NULL DEFAULT 'USD'"),
-                ('source',       "VARCHAR(20) NOT NULL DEFAULT 'Crawl'"),
-                ('bank',         "VARCHAR(10) DEFAULT 'SBV'"),
-                ('buy_transfer', 'FLOAT'),
-                ('buy_cash',     'FLOAT'),
-                ('sell_rate',    'FLOAT'),
-            ]:
-                try:
-                    conn.execute(text(f"ALTER TABLE vn_macro_fxrate_daily ADD COLUMN IF NOT EXISTS {col} {definition}"))
-                    conn.commit()
-                except Exception:
-                    conn.rollback()
+        with engine_crawl.begin() as conn:
+            conn.execute(text("""
+                ALTER TABLE vn_macro_fxrate_daily
+                    ADD COLUMN IF NOT EXISTS type VARCHAR(20) NOT NULL DEFAULT 'USD',
+                    ADD COLUMN IF NOT EXISTS source VARCHAR(20) NOT NULL DEFAULT 'Crawl',
+                    ADD COLUMN IF NOT EXISTS bank VARCHAR(10) DEFAULT 'SBV',
+                    ADD COLUMN IF NOT EXISTS buy_transfer FLOAT,
+                    ADD COLUMN IF NOT EXISTS buy_cash FLOAT,
+                    ADD COLUMN IF NOT EXISTS sell_rate FLOAT
+            """))
     except Exception as e:
         print(f"  Schema migration warning: {e}")
 
@@ -354,43 +391,52 @@ def generate_fxrate_data():
         ('VCB', 'JPY'),
     ]
 
+    try:
+        with engine_crawl.connect() as conn:
+            result = conn.execute(text("""
+                SELECT bank, type,
+                       array_agg(to_char(date::date, 'YYYY-MM-DD') ORDER BY date),
+                       array_agg(COALESCE(usd_vnd_rate, 0)::float8 ORDER BY date),
+                       array_agg(NULLIF(buy_cash, 0)::float8 ORDER BY date),
+                       array_agg(NULLIF(sell_rate, 0)::float8 ORDER BY date)
+                FROM (
+                    SELECT DISTINCT ON (bank, type, date) bank, type, date, usd_vnd_rate, buy_cash, sell_rate
+                    FROM vn_macro_fxrate_daily
+                    WHERE date >= :since
+                    AND bank = ANY(:banks)
+                    AND type = ANY(:currencies)
+                    AND usd_vnd_rate IS NOT NULL
+                    ORDER BY bank, type, date, crawl_time DESC
+                ) s
+                GROUP BY bank, type
+            """), {
+                'since': get_date_filter(WIDEST_PERIOD),
+                'banks': sorted({b for b, _ in combos}),
+                'currencies': sorted({c for _, c in combos}),
+            })
+            by_combo = {(row[0], row[1]): _columns(row[2:]) for row in result}
+    except Exception as e:
+        print(f"  Skipping fxrate: {e}")
+        return
+
     for bank, currency in combos:
-        for period in ['7d', '1m', '1y']:
-            date_filter = get_date_filter(period)
-
-            try:
-                with engine_crawl.connect() as conn:
-                    result = conn.execute(text(f"""
-                        SELECT date, usd_vnd_rate, buy_cash, sell_rate
-                        FROM (
-                            SELECT DISTINCT ON (date) date, usd_vnd_rate, buy_cash, sell_rate, crawl_time
-                            FROM vn_macro_fxrate_daily
-                            WHERE date >= '{date_filter}'
-                            AND type = '{currency}'
-                            AND bank = '{bank}'
-                            AND usd_vnd_rate IS NOT NULL
-                            ORDER BY date, crawl_time DESC
-                        ) subquery
-                        ORDER BY date ASC
-                    """))
-                    rows = result.fetchall()
-            except Exception as e:
-                print(f"  Skipping fxrate_{bank}_{currency}_{period}: {e}")
-                continue
+        for period in SERIES_PERIODS:
+            dates, rate, buy_cash, sell_rate = _slice_since(
+                by_combo.get((bank, currency), [[], [], [], []]), period)
 
             data = {
                 'bank': bank,
                 'currency': currency,
                 'period': period,
-                'count': len(rows),
-                'dates': [row[0].strftime('%Y-%m-%d') if hasattr(row[0], 'strftime') else str(row[0]) for row in rows],
-                'usd_vnd_rate': [float(row[1]) if row[1] else 0 for row in rows],
-                'buy_cash': [float(row[2]) if row[2] else None for row in rows],
-                'sell_rate': [float(row[3]) if row[3] else None for row in rows],
+                'count': len(dates),
+                'dates': dates,
+                'usd_vnd_rate': rate,
+                'buy_cash': buy_cash,
+                'sell_rate': sell_rate,
             }
 
             save_json(f'fxrate_{bank}_{currency}_{period}.json', data)
-            print(f"  fxrate_{bank}_{currency}_{period}.json: {len(rows)} rows")
+            print(f"  fxrate_{bank}_{currency}_{period}.json: {len(dates)} rows")
 
 
 # ============================================================
@@ -405,35 +451,39 @@ def generate_global_data():
         return
 
     try:
-        for period in ['7d', '1m', '1y']:
-            date_filter = get_date_filter(period)
-
-            with engine_global.connect() as conn:
-                result = conn.execute(text(f"""
-                    SELECT date, gold_price, silver_price, nasdaq_price, sp500_price, dowjones_price
-                    FROM (
-                        SELECT DISTINCT ON (date) date, gold_price, silver_price, nasdaq_price, sp500_price, dowjones_price, crawl_time
-                        FROM global_macro
-                        WHERE date >= '{date_filter}'
-                        ORDER BY date, crawl_time DESC
-                    ) subquery
-                    ORDER BY date ASC
-                """))
-                rows = result.fetchall()
+        with engine_global.connect() as conn:
+            result = conn.execute(text("""
+                SELECT array_agg(to_char(date::date, 'YYYY-MM-DD') ORDER BY date),
+                       array_agg(COALESCE(gold_price, 0)::float8 ORDER BY date),
+                       array_agg(COALESCE(silver_price, 0)::float8 ORDER BY date),
+                       array_agg(COALESCE(nasdaq_price, 0)::float8 ORDER BY date),
+                       array_agg(COALESCE(sp500_price, 0)::float8 ORDER BY date),
+                       array_agg(COALESCE(dowjones_price, 0)::float8 ORDER BY date)
+                FROM (
+                    SELECT DISTINCT ON (date) date, gold_price, silver_price, nasdaq_price, sp500_price, dowjones_price
+                    FROM global_macro
+                    WHERE date >= :since
+                    ORDER BY date, crawl_time DESC
+                ) s
+            """), {'since': get_date_filter(WIDEST_PERIOD)})
+            series = _columns(result.one())
+
+        for period in SERIES_PERIODS:
+            dates, gold, silver, nasdaq, sp500, dowjones = _slice_since(series, period)
 
             data = {
                 'period': period,
-                'count': len(rows),
-                'dates': [row[0].strftime('%Y-%m-%d') if hasattr(row[0], 'strftime') else str(row[0]) for row in rows],
-                'gold_prices': [float(row[1]) if row[1] else 0 for row in rows],
-                'silver_prices': [float(row[2]) if row[2] else 0 for row in rows],
-                'nasdaq_prices': [float(row[3]) if row[3] else 0 for row in rows],
-                'sp500_prices': [float(row[4]) if row[4] else 0 for row in rows],
-                'dowjones_prices': [float(row[5]) if row[5] else 0 for row in rows]
+                'count': len(dates),
+                'dates': dates,
+                'gold_prices': gold,
+                'silver_prices': silver,
+                'nasdaq_prices': nasdaq,
+                'sp500_prices': sp500,
+                'dowjones_prices': dowjones
             }
 
             save_json(f'global_{period}.json', data)
-            print(f"  global_{period}.json: {len(rows)} rows")
+            print(f"  global_{period}.json: {len(dates)} rows")
 
     except Exception as e:
         print(f"  Error generating global macro data: {e}")
@@ -485,11 +535,14 @@ def generate_manifest():
     """Generate manifest file listing all available static data."""
     print("\n--- Generating Manifest ---")
 
-    files = list(STATIC_DIR.glob('*.json'))
+    # scandir: names straight from the directory read, no Path per entry
+    with os.scandir(STATIC_DIR) as entries:
+        names = [e.name for e in entries
+                 if e.name.endswith('.json') and e.name != 'manifest.json' and e.is_file()]
     manifest = {
-        'generated_at': datetime.now().isoformat(),
-        'files': [f.name for f in files if f.name != 'manifest.json'],
-        'count': len(files) - 1  # Exclude manifest itself
+        'generated_at': datetime.now(),
+        'files': names,
+        'count': len(names)
     }
 
     save_json('manifest.json', manifest)
@@ -498,6 +551,23 @@ def generate_manifest():
 # ============================================================
 # MAIN
 # ============================================================
+# Generators are independent (own tables, own output files) and spend their
+# time waiting on Neon, so they run side by side; the manifest lists whatever
+# they wrote, so it runs last.
+GENERATORS = [
+    generate_gold_data,
+    generate_silver_data,
+    generate_vnindex_data,
+    generate_sbv_data,
+    generate_fxrate_data,
+    generate_termdepo_data,
+    generate_global_data,
+    generate_market_pulse_data,
+    generate_cpi_data,
+]
+GENERATOR_WORKERS = 6
+
+
 def main():
     print("=" * 60)
     print("Static Data Generator")
@@ -505,15 +575,11 @@ def main():
     print("=" * 60)
 
     try:
-        generate_gold_data()
-        generate_silver_data()
-        generate_vnindex_data()
-        generate_sbv_data()
-        generate_fxrate_data()
-        generate_termdepo_data()
-        generate_global_data()
-        generate_market_pulse_data()
-        generate_cpi_data()
+        with ThreadPoolExecutor(max_workers=GENERATOR_WORKERS) as pool:
+            futures = [pool.submit(gen) for gen in GENERATORS]
+        # Re-raise the first failure (in GENERATORS order) once all have finished
+        for future in futures:
+            future.result()
         generate_manifest()
 
         print("\n" + "=" * 60)
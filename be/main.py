@@ -15,7 +15,7 @@ from fastapi.staticfiles import StaticFiles
 from database import engine, Base
 from payment import router as payment_router
 from core.config import ALLOW_ORIGINS
-from core.startup import migrate_crawl_db
+from core.startup import migrate_crawl_db, warm_auth0_jwks
 from routers import market_data, analysis, auth_routes, interest, admin, developer, vn30_data, student_verify, knowledge, wallet, seller, reports, takedown, webhooks, feedback
 
 # ── DB schema migrations ──────────────────────────────────────────────────────
@@ -23,6 +23,9 @@ from routers import market_data, analysis, auth_routes, interest, admin, develop
 # CRAWLING_BOT_DB ALTER TABLE → vẫn cần thủ công vì không dùng Alembic.
 migrate_crawl_db()
 
+# Auth0 signing keys — fetched at boot so the first bearer request skips it.
+warm_auth0_jwks()
+
 # ── App ───────────────────────────────────────────────────────────────────────
 app = FastAPI(
     title="Agent Finance API",
@@ -45,6 +48,8 @@ METERED_PREFIXES = (
     "/api/v1/sbv-centralrate",
     "/api/v1/termdepo",        # termdepo + termdepo/banks
     "/api/v1/global",          # global + global-macro
+    "/api/v1/dashboard",       # gold + silver + sbv-interbank + termdepo + global
+                               # → 5 quota units (quota.REQUEST_UNITS)
     "/api/v1/vn30",            # vn30 data
     "/api/v1/macro",           # macro (CPI/GDP/trade) — chart CPI công khai giờ
                                # đọc data/cpi_*.json nên gate live endpoint an toàn.
@@ -4,11 +4,22 @@ from typing import Optional
 
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
-from jose import JWTError
+from jwt import PyJWTError as JWTError
 from sqlalchemy import text
 
 from auth import verify_auth0_token, get_user_level, get_user_is_admin, NAMESPACE
-from quota import check_and_consume
+from quota import check_and_consume, request_units
+
+
+# One round trip instead of "by auth0_id, then by email": the row already linked
+# to this auth0_id sorts first, a pre-existing account with the same email second.
+_SELECT_USER_BY_AUTH0_OR_EMAIL = text("""
+    SELECT user_id, user_level, is_admin, auth0_id
+    FROM users
+    WHERE auth0_id = :aid OR email = :em
+    ORDER BY auth0_id IS NOT DISTINCT FROM :aid DESC
+    LIMIT 1
+""")
 
 
 async def _log_api_call(
@@ -92,6 +103,7 @@ async def _auth_via_api_key(request: Request, api_key: str) -> bool:
                 user_id=user_id,
                 user_level=user_level,
                 plan=current_plan,
+                units=request_units(request.url.path),
             )
 
             if not q.allowed:
@@ -217,7 +229,8 @@ async def _auth_via_bearer(request: Request, token: str) -> bool:
 
         with engine.begin() as conn:
             q = check_and_consume(conn, user_id=user_id,
-                                  user_level=user_level, plan=current_plan)
+                                  user_level=user_level, plan=current_plan,
+                                  units=request_units(request.url.path))
             if not q.allowed:
                 _raise_quota_exceeded(q)
             conn.execute(text("""
@@ -276,33 +289,19 @@ async def authenticate_user(request: Request):
 
         # Read user_level from DB (JWT custom claims require Auth0 Action to be set up;
         # DB is always authoritative)
+        # (fallback by email covers a pre-existing anonymous user not yet linked)
         from core.engines import get_engine_user
-        from sqlalchemy import text as _text
-        user_level = "free"
-        is_admin   = False
         with get_engine_user().connect() as conn:
             row = conn.execute(
-                _text("SELECT user_level, is_admin FROM users WHERE auth0_id = :aid"),
-                {"aid": auth0_id},
+                _SELECT_USER_BY_AUTH0_OR_EMAIL,
+                {"aid": auth0_id, "em": email or None},
             ).fetchone()
-            if row:
-                user_level = row[0]
-                is_admin   = bool(row[1])
-            elif email:
-                # Fallback: pre-existing anonymous user not yet linked
-                row = conn.execute(
-                    _text("SELECT user_level, is_admin FROM users WHERE email = :em"),
-                    {"em": email},
-                ).fetchone()
-                if row:
-                    user_level = row[0]
-                    is_admin   = bool(row[1])
 
         request.state.user = {
             "auth0_id":   auth0_id,
             "email":      email,
-            "user_level": user_level,
-            "is_admin":   is_admin,
+            "user_level": row[1] if row else "free",
+            "is_admin":   bool(row[2]) if row else False,
             "user_id":    row[0] if row else None,
             "auth_method": "bearer",
         }
@@ -344,28 +343,21 @@ async def authenticate_user_optional(request: Request):
         auth0_id = payload.get("sub")
         email    = payload.get(f"{NAMESPACE}/email") or payload.get("email", "")
 
-        # Look up user_level from DB — try auth0_id first, fall back to email
+        # Look up user_level from DB — auth0_id first, email as fallback (one query)
         from core.engines import get_engine_user
-        from sqlalchemy import text as _text
         with get_engine_user().connect() as conn:
             row = conn.execute(
-                _text("SELECT user_id, user_level, is_admin, auth0_id FROM users WHERE auth0_id = :aid"),
-                {"aid": auth0_id},
+                _SELECT_USER_BY_AUTH0_OR_EMAIL,
+                {"aid": auth0_id, "em": email or None},
             ).fetchone()
 
-            if not row and email:
-                # Pre-existing user (anonymous/internal) — link auth0_id on the fly
-                row = conn.execute(
-                    _text("SELECT user_id, user_level, is_admin, auth0_id FROM users WHERE email = :em"),
-                    {"em": email},
-                ).fetchone()
-                if row and row[3] is None:
-                    # auth0_id not yet set — link it now
-                    conn.execute(
-                        _text("UPDATE users SET auth0_id = :aid WHERE user_id = :uid"),
-                        {"aid": auth0_id, "uid": row[0]},
-                    )
-                    conn.commit()
+            if row and row[3] is None:
+                # Pre-existing user (anonymous/internal) matched by email — link auth0_id on the fly
+                conn.execute(
+                    text("UPDATE users SET auth0_id = :aid WHERE user_id = :uid"),
+                    {"aid": auth0_id, "uid": row[0]},
+                )
+                conn.commit()
 
         user_level = row[1] if row else "free"
         is_admin   = bool(row[2]) if row else False
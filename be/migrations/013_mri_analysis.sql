@@ -0,0 +1,20 @@
+-- 013: own the mri_analysis schema (ARGUS_FINTEL_DB) as a one-shot migration.
+-- Previously 1s_market_pulse.py ran CREATE TABLE + ALTER on every pipeline run
+-- (4x daily) in their own commits before the dedup SELECT. The pipeline now only
+-- reads/writes; apply this once per database instead.
+
+CREATE TABLE IF NOT EXISTS mri_analysis (
+    id            SERIAL PRIMARY KEY,
+    title         TEXT NOT NULL,
+    brief_content TEXT,
+    source_name   TEXT,
+    source_date   TEXT,
+    url           TEXT,
+    label         TEXT,
+    mri           INTEGER,
+    generated_at  TIMESTAMP,
+    lang          TEXT DEFAULT 'vi'
+);
+
+-- Tables created before the VI/EN split lack the lang column.
+ALTER TABLE mri_analysis ADD COLUMN IF NOT EXISTS lang TEXT DEFAULT 'vi';
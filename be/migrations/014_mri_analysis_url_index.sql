@@ -0,0 +1,7 @@
+-- 014: index the market pulse dedup lookup on mri_analysis (ARGUS_FINTEL_DB).
+-- 1s_market_pulse.py asks "which of these crawled URLs were saved in the last
+-- 48h" with url = ANY(:urls) AND generated_at > NOW() - 48h; this turns it into
+-- an index scan instead of a full-table scan as the table grows.
+
+CREATE INDEX IF NOT EXISTS idx_mri_analysis_url_generated_at
+    ON mri_analysis (url, generated_at);
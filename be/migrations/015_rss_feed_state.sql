@@ -0,0 +1,11 @@
+-- 015: per-feed HTTP validators for 1s Market Pulse (ARGUS_FINTEL_DB).
+-- The pipeline runs in fresh CI checkouts, so the ETag / Last-Modified of each
+-- RSS feed is kept here; the next run sends them as If-None-Match /
+-- If-Modified-Since and unchanged feeds answer 304 with no body.
+
+CREATE TABLE IF NOT EXISTS rss_feed_state (
+    url        TEXT PRIMARY KEY,
+    etag       TEXT,
+    modified   TEXT,
+    checked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,28 @@
+-- 016: indexes for the /api/v1 series reads on CRAWLING_BOT_DB.
+-- Every endpoint in routers/market_data.py (and generate_static_data.py) runs
+--   SELECT DISTINCT ON (date) ... WHERE date >= :from [AND <series key> = :k]
+--   ORDER BY date, crawl_time DESC
+-- Leading with the equality key, then date, then crawl_time DESC lets the planner
+-- range-scan one series already in DISTINCT ON order — no seq scan, no sort.
+-- B-tree rather than BRIN: several series (gold types, banks) are interleaved in
+-- insert order, so block ranges do not correlate with one series' dates.
+-- global_macro (GLOBAL_INDICATOR_DB) already has UNIQUE (date); nothing to add.
+-- CONCURRENTLY so the crawlers keep writing while the indexes build. It cannot
+-- run inside a transaction block: run_016.py issues each statement separately
+-- in autocommit. A failed concurrent build leaves an INVALID index that
+-- IF NOT EXISTS would skip — DROP INDEX it before re-running.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vn_macro_gold_daily_type_date
+    ON vn_macro_gold_daily (type, date, crawl_time DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vn_macro_silver_daily_date
+    ON vn_macro_silver_daily (date, crawl_time DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vn_macro_sbv_rate_daily_date
+    ON vn_macro_sbv_rate_daily (date, crawl_time DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vn_macro_fxrate_daily_type_bank_date
+    ON vn_macro_fxrate_daily (type, bank, date, crawl_time DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vn_macro_termdepo_daily_bank_date
+    ON vn_macro_termdepo_daily (bank_code, date, crawl_time DESC);
@@ -0,0 +1,24 @@
+"""Run migration 014 on ARGUS_FINTEL_DB (mri_analysis dedup index for 1s Market Pulse)."""
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+
+# Load from project root .env (two levels above this file: be/migrations/ -> repo root)
+load_dotenv(Path(__file__).resolve().parent.parent.parent / '.env')
+load_dotenv(Path(__file__).resolve().parent.parent / '.env')
+
+DB_URL = os.getenv("ARGUS_FINTEL_DB")
+if not DB_URL:
+    sys.exit("ARGUS_FINTEL_DB not set — add it to .env and retry")
+
+sql_path = Path(__file__).resolve().parent / "014_mri_analysis_url_index.sql"
+sql = sql_path.read_text(encoding="utf-8")
+
+engine = create_engine(DB_URL)
+with engine.begin() as conn:
+    conn.execute(text(sql))
+
+print("Migration 014 applied to ARGUS_FINTEL_DB")
@@ -0,0 +1,24 @@
+"""Run migration 015 on ARGUS_FINTEL_DB (RSS feed state for 1s Market Pulse)."""
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+
+# Load from project root .env (two levels above this file: be/migrations/ -> repo root)
+load_dotenv(Path(__file__).resolve().parent.parent.parent / '.env')
+load_dotenv(Path(__file__).resolve().parent.parent / '.env')
+
+DB_URL = os.getenv("ARGUS_FINTEL_DB")
+if not DB_URL:
+    sys.exit("ARGUS_FINTEL_DB not set — add it to .env and retry")
+
+sql_path = Path(__file__).resolve().parent / "015_rss_feed_state.sql"
+sql = sql_path.read_text(encoding="utf-8")
+
+engine = create_engine(DB_URL)
+with engine.begin() as conn:
+    conn.execute(text(sql))
+
+print("Migration 015 applied to ARGUS_FINTEL_DB")
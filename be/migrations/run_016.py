@@ -0,0 +1,43 @@
+"""Run migration 016 on CRAWLING_BOT_DB (date indexes for the market data series)."""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+
+# Load from project root .env (two levels above this file: be/migrations/ -> repo root)
+load_dotenv(Path(__file__).resolve().parent.parent.parent / '.env')
+load_dotenv(Path(__file__).resolve().parent.parent / '.env')
+
+DB_URL = os.getenv("CRAWLING_BOT_DB")
+if not DB_URL:
+    sys.exit("CRAWLING_BOT_DB not set — add it to .env and retry")
+
+sql_path = Path(__file__).resolve().parent / "016_crawl_series_indexes.sql"
+sql = sql_path.read_text(encoding="utf-8")
+
+# One statement per index (comments stripped); each table is built on its own
+# autocommit connection, up to BUILD_WORKERS builds at a time
+statements = [
+    stmt.strip() for stmt in
+    "\n".join(line for line in sql.splitlines() if not line.lstrip().startswith("--")).split(";")
+    if stmt.strip()
+]
+
+BUILD_WORKERS = 4
+engine = create_engine(DB_URL, pool_size=BUILD_WORKERS)
+
+
+def build(stmt):
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(stmt))
+    return stmt.split("EXISTS", 1)[1].split()[0]
+
+
+with ThreadPoolExecutor(max_workers=BUILD_WORKERS) as pool:
+    for name in pool.map(build, statements):
+        print(f"  {name}")
+
+print("Migration 016 applied to CRAWLING_BOT_DB")
@@ -27,10 +27,9 @@ import requests
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from sqlalchemy import text
-from sqlalchemy.orm import sessionmaker
 
 from middleware import authenticate_user
-from core.engines import get_engine_user
+from core.engines import get_engine_user, get_session_user
 
 router = APIRouter(prefix="/api/v1/payment", tags=["payment"])
 
@@ -64,8 +63,7 @@ def _get_engine():
 
 
 def _session():
-    Session = sessionmaker(bind=_get_engine())
-    return Session()
+    return get_session_user()
 
 
 # ============================================================
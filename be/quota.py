@@ -12,6 +12,8 @@ Chính sách (đã quyết định):
     10 req/s cho premium_developer, 100 req/s cho admin. Khi scale lên multi-worker
     migrate sang Postgres advisory lock / Redis.
   - Quota month reset theo timezone Asia/Ho_Chi_Minh (business VN).
+  - Endpoint gộp nhiều series tính theo số series (REQUEST_UNITS): /api/v1/dashboard
+    trả 5 series metered nên trừ 5 request, không rẻ hơn gọi lẻ từng endpoint.
 """
 
 from __future__ import annotations
@@ -50,6 +52,17 @@ QUOTA_BY_PLAN = {
 }
 
 
+# Quota units per request, for metered endpoints that bundle several series.
+# Anything not listed costs 1.
+REQUEST_UNITS = {
+    "/api/v1/dashboard": 5,   # gold + silver + sbv-interbank + termdepo + global
+}
+
+
+def request_units(path: str) -> int:
+    return REQUEST_UNITS.get(path.rstrip("/"), 1)
+
+
 def get_quota(user_level: str, plan: Optional[str]) -> Optional[dict]:
     """Trả về quota config cho user, hoặc None nếu tier không có API access."""
     if plan and plan in QUOTA_BY_PLAN:
@@ -131,6 +144,7 @@ def check_and_consume(
     user_id: int,
     user_level: str,
     plan: Optional[str],
+    units: int = 1,
 ) -> QuotaResult:
     """
     Gọi trong cùng transaction với middleware auth. Raises no exception — trả
@@ -139,7 +153,7 @@ def check_and_consume(
     - Nếu tier không có API access → QuotaResult(allowed=False, reason='no_access').
     - Nếu cạn burst → allowed=False, reason='burst'.
     - Nếu cạn monthly → allowed=False, reason='monthly'.
-    - Nếu OK → allowed=True, INCREMENT counter và trả remaining.
+    - Nếu OK → allowed=True, INCREMENT counter thêm `units` và trả remaining.
     """
     quota = get_quota(user_level, plan)
     reset_at = next_month_reset_at()
@@ -171,21 +185,21 @@ def check_and_consume(
     # UPSERT + increment atomically; nếu cạn thì rollback
     row = conn.execute(text("""
         INSERT INTO api_usage_monthly (user_id, quota_month, request_count, updated_at)
-        VALUES (:uid, :qm, 1, NOW())
+        VALUES (:uid, :qm, :n, NOW())
         ON CONFLICT (user_id, quota_month)
-        DO UPDATE SET request_count = api_usage_monthly.request_count + 1,
+        DO UPDATE SET request_count = api_usage_monthly.request_count + :n,
                       updated_at    = NOW()
         RETURNING request_count
-    """), {"uid": user_id, "qm": qmonth}).fetchone()
-    used = row[0] if row else 1
+    """), {"uid": user_id, "qm": qmonth, "n": units}).fetchone()
+    used = row[0] if row else units
 
     if monthly_limit is not None and used > monthly_limit:
         # Đã increment rồi — rollback bằng decrement để giữ counter chính xác
         conn.execute(text("""
             UPDATE api_usage_monthly
-            SET request_count = request_count - 1
+            SET request_count = request_count - :n
             WHERE user_id = :uid AND quota_month = :qm
-        """), {"uid": user_id, "qm": qmonth})
+        """), {"uid": user_id, "qm": qmonth, "n": units})
         return QuotaResult(
             allowed=False, reason="monthly",
             monthly_limit=monthly_limit, used_this_month=monthly_limit,
@@ -10,11 +10,12 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import text
 
-from core.engines import get_engine_user
+from core.engines import UNCAP_TRANSACTION_SQL, get_engine_user
 from middleware import authenticate_user
 from payment import SUBSCRIPTION_PLANS, _query_payos_order
 
@@ -23,8 +24,7 @@ router = APIRouter()
 
 def _json_response(data: dict) -> Response:
     raw = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
-    return Response(content=raw, media_type="application/json",
-                    headers={"Content-Length": str(len(raw))})
+    return Response(content=raw, media_type="application/json")
 
 
 def _require_admin(request: Request):
@@ -622,6 +622,69 @@ async def signup_trend(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_EXPORT_BATCH = 500
+_UNCAP_TRANSACTION = text(UNCAP_TRANSACTION_SQL)
+
+
+def _open_users_export(where: str, params: dict):
+    """Run the export query on a server-side cursor (stream_results) and fetch
+    the first batch, so DB errors surface before the response starts and the
+    endpoint can still answer 500. Returns (conn, result, first batch);
+    _iter_users_csv closes the connection."""
+    conn = get_engine_user().connect()
+    try:
+        # Lift the API session caps: a slow client leaves this transaction
+        # idle between batches for as long as it takes to read one
+        conn.execute(_UNCAP_TRANSACTION)
+        result = conn.execution_options(
+            stream_results=True, yield_per=_EXPORT_BATCH,
+        ).execute(text(f"""
+            SELECT email, name, user_level, current_plan,
+                   is_premium, premium_expiry, api_request_count,
+                   created_at, updated_at
+            FROM users
+            {where}
+            ORDER BY created_at DESC
+        """), params)
+        return conn, result, result.fetchmany(_EXPORT_BATCH)
+    except Exception:
+        conn.close()
+        raise
+
+
+def _iter_users_csv(conn, result, first):
+    """Yield the user export as CSV text, one chunk per _EXPORT_BATCH rows.
+
+    Reads from the server-side cursor opened by _open_users_export, so the user
+    table is never fully materialized in memory — peak RSS stays O(batch) as
+    the table grows.
+    """
+    try:
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(["email", "name", "user_level", "current_plan",
+                         "is_premium", "premium_expiry", "api_calls",
+                         "created_at", "updated_at"])
+        batch = first
+        while batch:
+            for r in batch:
+                writer.writerow([
+                    r[0], r[1], r[2], r[3], r[4],
+                    r[5].isoformat() if r[5] else "",
+                    r[6],
+                    r[7].isoformat() if r[7] else "",
+                    r[8].isoformat() if r[8] else "",
+                ])
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            batch = result.fetchmany(_EXPORT_BATCH)
+        if output.tell():
+            yield output.getvalue()
+    finally:
+        conn.close()
+
+
 @router.get("/api/v1/admin/users/export")
 async def export_users_csv(
     request: Request,
@@ -631,49 +694,24 @@ async def export_users_csv(
     """Export user list as CSV. Admin only."""
     await authenticate_user(request)
     _require_admin(request)
-    try:
-        with get_engine_user().connect() as conn:
-            where_clauses = []
-            params: dict = {}
-            if q:
-                where_clauses.append("email ILIKE :q")
-                params["q"] = f"%{q}%"
-            if level:
-                where_clauses.append("user_level = :level")
-                params["level"] = level
-            where = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
-
-            rows = conn.execute(text(f"""
-                SELECT email, name, user_level, current_plan,
-                       is_premium, premium_expiry, api_request_count,
-                       created_at, updated_at
-                FROM users
-                {where}
-                ORDER BY created_at DESC
-            """), params).fetchall()
+    where_clauses = []
+    params: dict = {}
+    if q:
+        where_clauses.append("email ILIKE :q")
+        params["q"] = f"%{q}%"
+    if level:
+        where_clauses.append("user_level = :level")
+        params["level"] = level
+    where = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["email", "name", "user_level", "current_plan",
-                         "is_premium", "premium_expiry", "api_calls",
-                         "created_at", "updated_at"])
-        for r in rows:
-            writer.writerow([
-                r[0], r[1], r[2], r[3], r[4],
-                r[5].isoformat() if r[5] else "",
-                r[6],
-                r[7].isoformat() if r[7] else "",
-                r[8].isoformat() if r[8] else "",
-            ])
-
-        filename = f"vd_users_{datetime.utcnow().strftime('%Y%m%d_%H%M')}.csv"
-        output.seek(0)
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-        )
-    except HTTPException:
-        raise
+    try:
+        conn, result, first = await run_in_threadpool(_open_users_export, where, params)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+    filename = f"vd_users_{datetime.utcnow().strftime('%Y%m%d_%H%M')}.csv"
+    return StreamingResponse(
+        _iter_users_csv(conn, result, first),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
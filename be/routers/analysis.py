@@ -1,7 +1,9 @@
+import asyncio
 import json
 import os
 import subprocess
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
 from sqlalchemy import text
 
@@ -13,8 +15,7 @@ router = APIRouter()
 
 def _json_response(data: dict) -> Response:
     raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
-    return Response(content=raw, media_type="application/json",
-                    headers={"Content-Length": str(len(raw))})
+    return Response(content=raw, media_type="application/json")
 
 
 @router.get("/api/v1/gold-analysis")
@@ -50,6 +51,76 @@ async def get_gold_analysis(
         raise HTTPException(status_code=500, detail=f"Failed to fetch gold analysis: {e}")
 
 
+def _market_pulse_articles(lang: str, limit: int) -> list:
+    articles = []
+    with get_engine_argus().connect() as conn:
+        try:
+            rows = conn.execute(text("""
+                SELECT id, title, brief_content, source_name, source_date,
+                       url, label, mri, generated_at, lang
+                FROM mri_analysis
+                WHERE lang = :lang
+                ORDER BY generated_at DESC
+                LIMIT :limit
+            """), {"lang": lang, "limit": limit}).fetchall()
+
+            for r in rows:
+                articles.append({
+                    "id": int(r[0]) if r[0] is not None else None,
+                    "title": str(r[1]) if r[1] else "",
+                    "brief_content": str(r[2]) if r[2] else "",
+                    "source_name": str(r[3]) if r[3] else "",
+                    "source_date": str(r[4]) if r[4] else None,
+                    "url": str(r[5]) if r[5] else "",
+                    "label": str(r[6]) if r[6] else "",
+                    "mri": int(r[7]) if r[7] is not None else 0,
+                    "generated_at": r[8].isoformat() if r[8] else None,
+                    "lang": str(r[9]) if len(r) > 9 and r[9] else "vi",
+                })
+        except Exception:
+            # Fallback: table may not have lang column yet
+            rows = conn.execute(text("""
+                SELECT id, title, brief_content, source_name, source_date,
+                       url, label, mri, generated_at
+                FROM mri_analysis
+                ORDER BY generated_at DESC
+                LIMIT :limit
+            """), {"limit": limit}).fetchall()
+
+            for r in rows:
+                articles.append({
+                    "id": int(r[0]) if r[0] is not None else None,
+                    "title": str(r[1]) if r[1] else "",
+                    "brief_content": str(r[2]) if r[2] else "",
+                    "source_name": str(r[3]) if r[3] else "",
+                    "source_date": str(r[4]) if r[4] else None,
+                    "url": str(r[5]) if r[5] else "",
+                    "label": str(r[6]) if r[6] else "",
+                    "mri": int(r[7]) if r[7] is not None else 0,
+                    "generated_at": r[8].isoformat() if r[8] else None,
+                    "lang": "vi",
+                })
+    return articles
+
+
+def _market_pulse_sources() -> list:
+    # Distinct source "brands" (first token of source_name) over the last 30 days,
+    # ungated, so the FE source filter lists every real source even when the article
+    # payload is a gated 4-item preview. Best-effort: never fail the main response.
+    sources = []
+    try:
+        with get_engine_argus().connect() as conn:
+            srows = conn.execute(text("""
+                SELECT DISTINCT source_name FROM mri_analysis
+                WHERE source_name IS NOT NULL AND source_name <> ''
+                  AND generated_at > now() - interval '30 days'
+            """)).fetchall()
+        sources = sorted({(r[0].strip().split() or [""])[0] for r in srows if r[0] and r[0].strip()})
+    except Exception:
+        sources = []
+    return sources
+
+
 @router.get("/api/v1/market-pulse")
 async def get_market_pulse(
     request: Request,
@@ -61,69 +132,12 @@ async def get_market_pulse(
     free_preview_count = None
 
     try:
-        articles = []
-        with get_engine_argus().connect() as conn:
-            try:
-                rows = conn.execute(text("""
-                    SELECT id, title, brief_content, source_name, source_date,
-                           url, label, mri, generated_at, lang
-                    FROM mri_analysis
-                    WHERE lang = :lang
-                    ORDER BY generated_at DESC
-                    LIMIT :limit
-                """), {"lang": lang, "limit": limit}).fetchall()
-
-                for r in rows:
-                    articles.append({
-                        "id": int(r[0]) if r[0] is not None else None,
-                        "title": str(r[1]) if r[1] else "",
-                        "brief_content": str(r[2]) if r[2] else "",
-                        "source_name": str(r[3]) if r[3] else "",
-                        "source_date": str(r[4]) if r[4] else None,
-                        "url": str(r[5]) if r[5] else "",
-                        "label": str(r[6]) if r[6] else "",
-                        "mri": int(r[7]) if r[7] is not None else 0,
-                        "generated_at": r[8].isoformat() if r[8] else None,
-                        "lang": str(r[9]) if len(r) > 9 and r[9] else "vi",
-                    })
-            except Exception:
-                # Fallback: table may not have lang column yet
-                rows = conn.execute(text("""
-                    SELECT id, title, brief_content, source_name, source_date,
-                           url, label, mri, generated_at
-                    FROM mri_analysis
-                    ORDER BY generated_at DESC
-                    LIMIT :limit
-                """), {"limit": limit}).fetchall()
-
-                for r in rows:
-                    articles.append({
-                        "id": int(r[0]) if r[0] is not None else None,
-                        "title": str(r[1]) if r[1] else "",
-                        "brief_content": str(r[2]) if r[2] else "",
-                        "source_name": str(r[3]) if r[3] else "",
-                        "source_date": str(r[4]) if r[4] else None,
-                        "url": str(r[5]) if r[5] else "",
-                        "label": str(r[6]) if r[6] else "",
-                        "mri": int(r[7]) if r[7] is not None else 0,
-                        "generated_at": r[8].isoformat() if r[8] else None,
-                        "lang": "vi",
-                    })
-
-        # Distinct source "brands" (first token of source_name) over the last 30 days,
-        # ungated, so the FE source filter lists every real source even when the article
-        # payload is a gated 4-item preview. Best-effort: never fail the main response.
-        sources = []
-        try:
-            with get_engine_argus().connect() as conn:
-                srows = conn.execute(text("""
-                    SELECT DISTINCT source_name FROM mri_analysis
-                    WHERE source_name IS NOT NULL AND source_name <> ''
-                      AND generated_at > now() - interval '30 days'
-                """)).fetchall()
-            sources = sorted({(r[0].strip().split() or [""])[0] for r in srows if r[0] and r[0].strip()})
-        except Exception:
-            sources = []
+        # Two independent queries — run them side by side in the threadpool so the
+        # response waits for the slower one, not both, and the event loop stays free.
+        articles, sources = await asyncio.gather(
+            run_in_threadpool(_market_pulse_articles, lang, limit),
+            run_in_threadpool(_market_pulse_sources),
+        )
 
         return _json_response({
             "success": True,
@@ -154,7 +168,10 @@ async def generate_market_pulse(request: Request):
             raise HTTPException(status_code=500, detail="Market pulse script not found")
 
         result = subprocess.run(
-            ["python3", script_path],
+            # An admin asking for a run wants one: skip the script's
+            # MARKET_PULSE_MIN_INTERVAL_HOURS guard, which exits 0 without
+            # generating anything and would read as success here.
+            ["python3", script_path, "--force"],
             cwd=os.path.dirname(script_path),
             capture_output=True,
             text=True,
@@ -3,11 +3,11 @@ from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import text
+from sqlalchemy import or_, text
 
-from core.engines import get_engine_user
+from core.engines import get_engine_user, get_session_user
 from auth import get_auth0_user_info, create_local_user_from_auth0, exchange_code_for_tokens
 from middleware import authenticate_user
 from models import User
@@ -16,7 +16,21 @@ router = APIRouter()
 
 
 def _get_session():
-    return sessionmaker(bind=get_engine_user())()
+    return get_session_user()
+
+
+def _find_user(session, auth0_id: str, email: str):
+    """
+    Tìm user theo auth0_id, fallback theo email — gộp vào một query thay vì hai.
+    User đã gắn auth0_id được ưu tiên; nếu trả về user khác auth0_id thì đó là
+    account trùng email (caller quyết định link hay tạo mới).
+    """
+    return (
+        session.query(User)
+        .filter(or_(User.auth0_id == auth0_id, User.email == (email or None)))
+        .order_by(User.auth0_id.is_not_distinct_from(auth0_id).desc())
+        .first()
+    )
 
 
 _LOGIN_SESSION_GAP = timedelta(minutes=30)
@@ -67,25 +81,15 @@ async def auth0_login():
     return RedirectResponse(url=f"https://{domain}/authorize?{urlencode(params)}")
 
 
-@router.get("/callback")
-async def auth0_callback(request: Request, code: str = None, error: str = None):
-    if error:
-        raise HTTPException(status_code=400, detail=f"Auth0 error: {error}")
-    if not code:
-        raise HTTPException(status_code=400, detail="No authorization code provided")
-
-    try:
-        tokens    = exchange_code_for_tokens(code)
-        id_token  = tokens.get("id_token")
-        user_info = get_auth0_user_info(id_token)
-
-        session = _get_session()
-        # Tìm theo auth0_id trước
-        user = session.query(User).filter_by(auth0_id=user_info["auth0_id"]).first()
+def _upsert_callback_user(user_info: dict, ip: str = None) -> dict:
+    """Tạo/link/cập nhật user từ Auth0 id_token + ghi login. ORM sync — gọi qua
+    run_in_threadpool để không chặn event loop trong lúc chờ Neon."""
+    with _get_session() as session:
+        # Tìm theo auth0_id trước, fallback theo email
+        user = _find_user(session, user_info["auth0_id"], user_info["email"])
 
-        if not user:
+        if not user or user.auth0_id != user_info["auth0_id"]:
             # Thử link với anonymous account có cùng email
-            user = session.query(User).filter_by(email=user_info["email"]).first()
             if user and user.auth0_id is None:
                 user.auth0_id          = user_info["auth0_id"]
                 user.name              = user_info.get("name")
@@ -100,11 +104,37 @@ async def auth0_callback(request: Request, code: str = None, error: str = None):
             user.picture        = user_info.get("picture")
             user.email_verified = user_info.get("email_verified", False)
 
-        _record_login(session, user, "google",
-                      request.client.host if request.client else None)
+        _record_login(session, user, "google", ip)
 
         session.commit()
-        session.close()
+        # Đọc khi session còn mở: commit expire các attribute, đọc sau
+        # close sẽ DetachedInstanceError.
+        return {
+            "email":          user.email,
+            "name":           user.name,
+            "picture":        user.picture,
+            "user_id":        user.id,
+            "auth0_id":       user.auth0_id,
+            "email_verified": user.email_verified,
+        }
+
+
+@router.get("/callback")
+async def auth0_callback(request: Request, code: str = None, error: str = None):
+    if error:
+        raise HTTPException(status_code=400, detail=f"Auth0 error: {error}")
+    if not code:
+        raise HTTPException(status_code=400, detail="No authorization code provided")
+
+    try:
+        # Auth0 token exchange + verify là HTTPS sync (requests) — cũng đưa ra threadpool
+        tokens    = await run_in_threadpool(exchange_code_for_tokens, code)
+        id_token  = tokens.get("id_token")
+        user_info = await run_in_threadpool(get_auth0_user_info, id_token)
+
+        user_out = await run_in_threadpool(
+            _upsert_callback_user, user_info,
+            request.client.host if request.client else None)
 
         return {
             "message":      "Auth0 login successful",
@@ -112,14 +142,7 @@ async def auth0_callback(request: Request, code: str = None, error: str = None):
             "id_token":     id_token,
             "token_type":   "Bearer",
             "expires_in":   tokens.get("expires_in"),
-            "user": {
-                "email":          user.email,
-                "name":           user.name,
-                "picture":        user.picture,
-                "user_id":        user.id,
-                "auth0_id":       user.auth0_id,
-                "email_verified": user.email_verified,
-            },
+            "user":         user_out,
         }
     except HTTPException:
         raise
@@ -140,27 +163,16 @@ async def auth0_logout():
     return RedirectResponse(url=f"https://{domain}/v2/logout?{urlencode(params)}")
 
 
-@router.get("/me")
-async def get_current_user_info(request: Request):
-    """
-    Trả thông tin user hiện tại. Auto-create nếu chưa có trong DB.
-    Nếu email trùng với anonymous account (chưa có auth0_id), tự động link lại.
-    """
-    try:
-        await authenticate_user(request)
-        user     = request.state.user
-        auth0_id = user.get("auth0_id")
-        if not auth0_id:
-            raise HTTPException(status_code=401, detail="Invalid token: missing auth0_id")
-
-        session = _get_session()
-        db_user = session.query(User).filter_by(auth0_id=auth0_id).first()
+def _upsert_me_user(user: dict, ip: str = None) -> dict:
+    """/me: đồng bộ user từ token claims vào DB (auto-create / link anonymous) +
+    ghi login, trả payload. ORM sync — gọi qua run_in_threadpool."""
+    auth0_id = user["auth0_id"]
+    with _get_session() as session:
+        email   = user.get("email", "")
+        db_user = _find_user(session, auth0_id, email)
 
-        if not db_user:
+        if not db_user or db_user.auth0_id != auth0_id:
             # Thử link với anonymous account có cùng email
-            email   = user.get("email", "")
-            db_user = session.query(User).filter_by(email=email).first()
-
             if db_user and db_user.auth0_id is None:
                 # Link anonymous → google
                 db_user.auth0_id          = auth0_id
@@ -189,11 +201,10 @@ async def get_current_user_info(request: Request):
             session.refresh(db_user)
 
         # Ghi nhận login (throttled — không trùng với /callback trong cùng phiên)
-        _record_login(session, db_user, "google",
-                      request.client.host if request.client else None)
+        _record_login(session, db_user, "google", ip)
         session.commit()
 
-        result = {
+        return {
             "email":             db_user.email,
             "name":              db_user.name,
             "picture":           db_user.picture,
@@ -209,8 +220,23 @@ async def get_current_user_info(request: Request):
             "created_at":        db_user.created_at.isoformat() if db_user.created_at else None,
             "updated_at":        db_user.updated_at.isoformat() if db_user.updated_at else None,
         }
-        session.close()
-        return result
+
+
+@router.get("/me")
+async def get_current_user_info(request: Request):
+    """
+    Trả thông tin user hiện tại. Auto-create nếu chưa có trong DB.
+    Nếu email trùng với anonymous account (chưa có auth0_id), tự động link lại.
+    """
+    try:
+        await authenticate_user(request)
+        user     = request.state.user
+        auth0_id = user.get("auth0_id")
+        if not auth0_id:
+            raise HTTPException(status_code=401, detail="Invalid token: missing auth0_id")
+
+        return await run_in_threadpool(
+            _upsert_me_user, user, request.client.host if request.client else None)
     except HTTPException:
         raise
     except Exception as e:
@@ -232,17 +258,21 @@ async def protected_endpoint(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _dashboard_row(auth0_id: str):
+    with get_engine_user().connect() as conn:
+        return conn.execute(text("""
+            SELECT last_login_at, login_count, api_request_count, created_at
+            FROM users WHERE auth0_id = :aid
+        """), {"aid": auth0_id}).fetchone()
+
+
 @router.get("/api/dashboard")
 async def dashboard_data(request: Request):
     try:
         await authenticate_user(request)
         user = request.state.user
         auth0_id = user.get("auth0_id")
-        with get_engine_user().connect() as conn:
-            row = conn.execute(text("""
-                SELECT last_login_at, login_count, api_request_count, created_at
-                FROM users WHERE auth0_id = :aid
-            """), {"aid": auth0_id}).fetchone()
+        row = await run_in_threadpool(_dashboard_row, auth0_id)
         last_login_at, login_count, api_request_count, created_at = (
             row if row else (None, 0, 0, None)
         )
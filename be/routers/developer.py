@@ -8,17 +8,16 @@ import secrets
 
 from fastapi import APIRouter, HTTPException, Request
 from sqlalchemy import text
-from sqlalchemy.orm import sessionmaker
 
 from middleware import authenticate_user
-from core.engines import get_engine_user
+from core.engines import get_engine_user, get_session_user
 from quota import read_usage
 
 router = APIRouter(prefix="/api/v1/developer", tags=["developer"])
 
 
 def _session():
-    return sessionmaker(bind=get_engine_user())()
+    return get_session_user()
 
 
 def _get_user_row(session, auth0_id: str):
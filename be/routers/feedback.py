@@ -40,8 +40,7 @@ class FeedbackRequest(BaseModel):
 
 def _json_response(data: dict) -> Response:
     raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
-    return Response(content=raw, media_type="application/json",
-                    headers={"Content-Length": str(len(raw))})
+    return Response(content=raw, media_type="application/json")
 
 
 def _clean(s):
@@ -42,8 +42,7 @@ class InterestRequest(BaseModel):
 
 def _json_response(data: dict) -> Response:
     raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
-    return Response(content=raw, media_type="application/json",
-                    headers={"Content-Length": str(len(raw))})
+    return Response(content=raw, media_type="application/json")
 
 
 @router.post("/api/v1/interest/{interest_type}")
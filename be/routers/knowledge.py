@@ -76,7 +76,6 @@ def _json_response(data: dict) -> Response:
     return Response(
         content=raw,
         media_type="application/json",
-        headers={"Content-Length": str(len(raw))},
     )
 
 
@@ -1,13 +1,16 @@
+import asyncio
 import csv
 import io
-import json
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
+import orjson
 from sqlalchemy import text
 
+from core.cache import cached_response
 from core.engines import get_engine_crawl, get_engine_global
 from core.config import ALLOWED_BANKS, ALLOWED_CURRENCIES
-from core.utils import get_date_filter
+from core.utils import PERIOD_DESCRIPTION, PERIOD_PATTERN, get_date_filter
 
 router = APIRouter()
 
@@ -20,9 +23,117 @@ def _paginate(rows: list, page: int, limit: int) -> tuple[list, int]:
 
 
 def _json_response(data: dict) -> Response:
-    raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
-    return Response(content=raw, media_type="application/json",
-                    headers={"Content-Length": str(len(raw))})
+    raw = orjson.dumps(data)  # UTF-8 bytes, non-ASCII kept as-is
+    return Response(content=raw, media_type="application/json")
+
+
+def _columns(rows, width: int) -> list[list]:
+    """Transpose (date, v1, v2, ...) rows into one list per column.
+
+    The _SERIES_SQL statements already return dates as "YYYY-MM-DD" text and
+    values as float8 with their NULL/0 policy applied, so the only Python work
+    is zip(*rows), which transposes in C.
+    """
+    return [list(col) for col in zip(*rows)] or [[] for _ in range(width)]
+
+
+# ── Series queries ─────────────────────────────────────────────────────────────
+# Every series endpoint is the same shape: latest crawl per date (DISTINCT ON),
+# oldest first, then transposed into columns. Only the table, value columns and
+# series key differ, so the statements live here and _fetch_series runs them.
+# Where DISTINCT ON is per date the outer ORDER BY date is already satisfied by
+# the subquery's sort, so the planner skips it.
+# Formatting happens in the outer SELECT: dates via to_char, values as float8
+# with COALESCE(x, 0) (missing → 0) or NULLIF(x, 0) (missing/0 → null), so
+# psycopg2 hands back ready-to-serialize str/float and Python never touches a cell.
+_SERIES_SQL = {
+    "gold": text("""
+        SELECT to_char(date::date, 'YYYY-MM-DD'),
+               COALESCE(buy_price, 0)::float8, COALESCE(sell_price, 0)::float8
+        FROM (
+            SELECT DISTINCT ON (date) date, buy_price, sell_price, crawl_time
+            FROM vn_macro_gold_daily
+            WHERE date >= :date_filter AND type = :gold_type
+            ORDER BY date, crawl_time DESC
+        ) s ORDER BY date
+    """),
+    "silver": text("""
+        SELECT to_char(date::date, 'YYYY-MM-DD'),
+               COALESCE(buy_price, 0)::float8, COALESCE(sell_price, 0)::float8
+        FROM (
+            SELECT DISTINCT ON (date) date, buy_price, sell_price, crawl_time
+            FROM vn_macro_silver_daily WHERE date >= :date_filter
+            ORDER BY date, crawl_time DESC
+        ) s ORDER BY date
+    """),
+    "sbv_interbank": text("""
+        SELECT to_char(date::date, 'YYYY-MM-DD'),
+               NULLIF(ls_quadem, 0)::float8, NULLIF(ls_1m, 0)::float8,
+               NULLIF(ls_3m, 0)::float8, NULLIF(ls_6m, 0)::float8, NULLIF(ls_9m, 0)::float8,
+               NULLIF(rediscount_rate, 0)::float8, NULLIF(refinancing_rate, 0)::float8
+        FROM (
+            SELECT DISTINCT ON (date) date, ls_quadem, ls_1m, ls_3m, ls_6m, ls_9m,
+                   rediscount_rate, refinancing_rate, crawl_time
+            FROM vn_macro_sbv_rate_daily
+            WHERE date >= :date_filter
+            ORDER BY date, crawl_time DESC
+        ) s ORDER BY date
+    """),
+    "termdepo": text("""
+        SELECT to_char(date::date, 'YYYY-MM-DD'),
+               COALESCE(term_1m, 0)::float8, COALESCE(term_3m, 0)::float8,
+               COALESCE(term_6m, 0)::float8, COALESCE(term_12m, 0)::float8,
+               COALESCE(term_24m, 0)::float8
+        FROM (
+            SELECT DISTINCT ON (date_trunc('month', date))
+                   date, term_1m, term_3m, term_6m, term_12m, term_24m, crawl_time
+            FROM vn_macro_termdepo_daily
+            WHERE date >= :date_filter AND bank_code = :bank_code
+            ORDER BY date_trunc('month', date), date DESC, crawl_time DESC
+        ) s ORDER BY date
+    """),
+    "global": text("""
+        SELECT to_char(date::date, 'YYYY-MM-DD'),
+               COALESCE(gold_price, 0)::float8, COALESCE(silver_price, 0)::float8,
+               COALESCE(nasdaq_price, 0)::float8
+        FROM (
+            SELECT DISTINCT ON (date) date, gold_price, silver_price, nasdaq_price, crawl_time
+            FROM global_macro WHERE date >= :date_filter
+            ORDER BY date, crawl_time DESC
+        ) s ORDER BY date
+    """),
+}
+
+# FX rate: SBV publishes a central rate, commercial banks a transfer buy rate.
+# rate_col comes from this fixed pair, never from the request.
+for _rate_col in ("usd_vnd_rate", "buy_transfer"):
+    _SERIES_SQL[f"fx_{_rate_col}"] = text(f"""
+        SELECT to_char(date::date, 'YYYY-MM-DD'),
+               COALESCE({_rate_col}, 0)::float8,
+               NULLIF(buy_cash, 0)::float8, NULLIF(sell_rate, 0)::float8
+        FROM (
+            SELECT DISTINCT ON (date) date, {_rate_col}, buy_cash, sell_rate, crawl_time
+            FROM vn_macro_fxrate_daily
+            WHERE date >= :date_filter AND type = :currency AND bank = :bank
+              AND {_rate_col} IS NOT NULL
+            ORDER BY date, crawl_time DESC
+        ) s ORDER BY date
+    """)
+
+
+def _fetch_rows(stmt, params: dict = None, get_engine=None) -> list:
+    """Blocking read on a pooled engine (CRAWLING_BOT_DB unless `get_engine` says
+    otherwise). Handlers are async, so call it through run_in_threadpool — a
+    direct call would stall the event loop for the whole Neon round trip."""
+    with (get_engine or get_engine_crawl)().connect() as conn:
+        return conn.execute(stmt, params or {}).fetchall()
+
+
+async def _fetch_series(key: str, params: dict, width: int, get_engine=None) -> list[list]:
+    """Run a _SERIES_SQL statement off the event loop and return its columns in
+    chronological order."""
+    rows = await run_in_threadpool(_fetch_rows, _SERIES_SQL[key], params, get_engine)
+    return _columns(rows, width)
 
 
 def _csv_response(header: list, rows: list) -> Response:
@@ -32,57 +143,34 @@ def _csv_response(header: list, rows: list) -> Response:
     writer.writerow(header)
     writer.writerows(rows)
     raw = output.getvalue().encode("utf-8")
-    return Response(content=raw, media_type="text/csv",
-                    headers={"Content-Length": str(len(raw))})
+    return Response(content=raw, media_type="text/csv")
 
 
 @router.get("/api/v1/gold")
+@cached_response
 async def get_gold_data(
     request: Request,
-    period: str = Query("1m", description="Time period: 7d, 1m, 1y, all"),
+    period: str = Query("1m", pattern=PERIOD_PATTERN, description=PERIOD_DESCRIPTION),
     type: str = Query("DOJI HN", description="Gold type"),
     page: int = Query(None, ge=1, description="Page number (enables row-based response)"),
     limit: int = Query(30, ge=1, le=500, description="Rows per page"),
     format: str = Query("json", description="json or csv (csv works with Google Sheets IMPORTDATA)"),
 ):
     try:
-        date_filter = get_date_filter(period)
-        query = text("""
-            SELECT date, buy_price, sell_price
-            FROM (
-                SELECT DISTINCT ON (date) date, buy_price, sell_price, crawl_time
-                FROM vn_macro_gold_daily
-                WHERE date >= :date_filter AND type = :gold_type
-                ORDER BY date, crawl_time DESC
-            ) s ORDER BY date DESC
-        """)
-        with get_engine_crawl().connect() as conn:
-            rows = conn.execute(query, {"date_filter": date_filter, "gold_type": type}).fetchall()
-
-        rows = list(reversed(rows))  # chronological order
+        dates, buy, sell = await _fetch_series(
+            "gold", {"date_filter": get_date_filter(period), "gold_type": type}, 3)
 
         if format == "csv":
-            csv_rows = [
-                [r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]),
-                 float(r[1]) if r[1] else 0,
-                 float(r[2]) if r[2] else 0]
-                for r in rows
-            ]
-            return _csv_response(["date", "buy_price", "sell_price"], csv_rows)
+            return _csv_response(["date", "buy_price", "sell_price"], zip(dates, buy, sell))
 
         if page is not None:
-            page_rows, total = _paginate(rows, page, limit)
-            data = [{"date": r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]),
-                     "buy_price": float(r[1]) if r[1] else 0,
-                     "sell_price": float(r[2]) if r[2] else 0} for r in page_rows]
+            page_rows, total = _paginate(list(zip(dates, buy, sell)), page, limit)
+            data = [{"date": r[0], "buy_price": r[1], "sell_price": r[2]} for r in page_rows]
             return _json_response({"success": True, "data": data,
                                    "total": total, "page": page, "limit": limit,
                                    "pages": (total + limit - 1) // limit,
                                    "type": type, "period": period})
 
-        dates = [r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]) for r in rows]
-        buy   = [float(r[1]) if r[1] else 0 for r in rows]
-        sell  = [float(r[2]) if r[2] else 0 for r in rows]
         return _json_response({"success": True,
                                "data": {"dates": dates, "buy_prices": buy, "sell_prices": sell},
                                "type": type, "period": period, "count": len(dates)})
@@ -93,18 +181,18 @@ async def get_gold_data(
 
 
 @router.get("/api/v1/gold/types")
+@cached_response
 async def get_gold_types(request: Request):
     try:
         # Loại silver (BẠC) bị crawl nhầm vào bảng gold — filter tại query layer
         # cho đến khi data cleanup + crawler fix xong.
-        with get_engine_crawl().connect() as conn:
-            rows = conn.execute(text("""
-                SELECT DISTINCT type FROM vn_macro_gold_daily
-                WHERE type IS NOT NULL
-                  AND type NOT ILIKE '%BẠC%'
-                  AND type NOT ILIKE '%BAC %'
-                ORDER BY type
-            """)).fetchall()
+        rows = await run_in_threadpool(_fetch_rows, text("""
+            SELECT DISTINCT type FROM vn_macro_gold_daily
+            WHERE type IS NOT NULL
+              AND type NOT ILIKE '%BẠC%'
+              AND type NOT ILIKE '%BAC %'
+            ORDER BY type
+        """))
         return _json_response({"success": True, "types": [r[0] for r in rows if r[0]]})
     except HTTPException:
         raise
@@ -113,36 +201,25 @@ async def get_gold_types(request: Request):
 
 
 @router.get("/api/v1/silver")
+@cached_response
 async def get_silver_data(
     request: Request,
-    period: str = Query("1m", description="Time period: 7d, 1m, 1y, all"),
+    period: str = Query("1m", pattern=PERIOD_PATTERN, description=PERIOD_DESCRIPTION),
     page: int = Query(None, ge=1),
     limit: int = Query(30, ge=1, le=500),
 ):
     try:
-        date_filter = get_date_filter(period)
-        with get_engine_crawl().connect() as conn:
-            rows = list(reversed(conn.execute(text("""
-                SELECT date, buy_price, sell_price FROM (
-                    SELECT DISTINCT ON (date) date, buy_price, sell_price, crawl_time
-                    FROM vn_macro_silver_daily WHERE date >= :date_filter
-                    ORDER BY date, crawl_time DESC
-                ) s ORDER BY date DESC
-            """), {"date_filter": date_filter}).fetchall()))
+        dates, buy, sell = await _fetch_series("silver", {"date_filter": get_date_filter(period)}, 3)
 
         if page is not None:
-            page_rows, total = _paginate(rows, page, limit)
-            data = [{"date": r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]),
-                     "buy_price": float(r[1]) if r[1] else 0,
-                     "sell_price": float(r[2]) if r[2] else 0} for r in page_rows]
+            page_rows, total = _paginate(list(zip(dates, buy, sell)), page, limit)
+            data = [{"date": r[0], "buy_price": r[1], "sell_price": r[2]} for r in page_rows]
             return _json_response({"success": True, "data": data,
                                    "total": total, "page": page, "limit": limit,
                                    "pages": (total + limit - 1) // limit, "period": period})
 
-        dates = [r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]) for r in rows]
         return _json_response({"success": True,
-                               "data": {"dates": dates, "buy_prices": [float(r[1]) if r[1] else 0 for r in rows],
-                                        "sell_prices": [float(r[2]) if r[2] else 0 for r in rows]},
+                               "data": {"dates": dates, "buy_prices": buy, "sell_prices": sell},
                                "period": period, "count": len(dates)})
     except HTTPException:
         raise
@@ -151,43 +228,24 @@ async def get_silver_data(
 
 
 @router.get("/api/v1/sbv-interbank")
+@cached_response
 async def get_sbv_interbank_data(
     request: Request,
-    period: str = Query("1m", description="Time period: 7d, 1m, 1y, all"),
+    period: str = Query("1m", pattern=PERIOD_PATTERN, description=PERIOD_DESCRIPTION),
 ):
     try:
-        date_filter = get_date_filter(period)
-        query = text("""
-            SELECT date, ls_quadem, ls_1m, ls_3m, ls_6m, ls_9m,
-                   rediscount_rate, refinancing_rate
-            FROM (
-                SELECT DISTINCT ON (date) date, ls_quadem, ls_1m, ls_3m, ls_6m, ls_9m,
-                       rediscount_rate, refinancing_rate, crawl_time
-                FROM vn_macro_sbv_rate_daily
-                WHERE date >= :date_filter
-                ORDER BY date, crawl_time DESC
-            ) s ORDER BY date DESC
-        """)
-        with get_engine_crawl().connect() as conn:
-            rows = conn.execute(query, {"date_filter": date_filter}).fetchall()
-
-        dates       = [r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]) for r in rows]
-        overnight   = [float(r[1]) if r[1] else None for r in rows]
-        month_1     = [float(r[2]) if r[2] else None for r in rows]
-        month_3     = [float(r[3]) if r[3] else None for r in rows]
-        month_6     = [float(r[4]) if r[4] else None for r in rows]
-        month_9     = [float(r[5]) if r[5] else None for r in rows]
-        rediscount  = [float(r[6]) if r[6] else None for r in rows]
-        refinancing = [float(r[7]) if r[7] else None for r in rows]
+        (dates, overnight, month_1, month_3, month_6, month_9,
+         rediscount, refinancing) = await _fetch_series(
+            "sbv_interbank", {"date_filter": get_date_filter(period)}, 8)
 
         return _json_response({
             "success": True,
             "data": {
-                "dates": dates[::-1],
-                "overnight": overnight[::-1], "month_1": month_1[::-1],
-                "month_3": month_3[::-1],     "month_6": month_6[::-1],
-                "month_9": month_9[::-1],
-                "rediscount": rediscount[::-1], "refinancing": refinancing[::-1],
+                "dates": dates,
+                "overnight": overnight, "month_1": month_1,
+                "month_3": month_3,     "month_6": month_6,
+                "month_9": month_9,
+                "rediscount": rediscount, "refinancing": refinancing,
             },
             "period": period, "count": len(dates),
         })
@@ -199,9 +257,10 @@ async def get_sbv_interbank_data(
 
 @router.get("/api/v1/sbv-rate")
 @router.get("/api/v1/sbv-centralrate")
+@cached_response
 async def get_sbv_central_rate(
     request: Request,
-    period: str = Query("1m", description="Time period: 7d, 1m, 1y, all"),
+    period: str = Query("1m", pattern=PERIOD_PATTERN, description=PERIOD_DESCRIPTION),
     bank: str = Query("VCB", description="Bank code"),
     currency: str = Query("USD", description="Currency code"),
     page: int = Query(None, ge=1),
@@ -216,35 +275,13 @@ async def get_sbv_central_rate(
         if currency_upper not in ALLOWED_CURRENCIES:
             raise HTTPException(status_code=400, detail=f"Currency không hợp lệ. Cho phép: {sorted(ALLOWED_CURRENCIES)}")
 
-        # rate_col is a column name validated against allowlist — safe to interpolate
-        rate_col    = "usd_vnd_rate" if bank_upper == "SBV" else "buy_transfer"
-        date_filter = get_date_filter(period)
-
-        query = text(f"""
-            SELECT date, {rate_col}, buy_cash, sell_rate
-            FROM (
-                SELECT DISTINCT ON (date) date, {rate_col}, buy_cash, sell_rate, crawl_time
-                FROM vn_macro_fxrate_daily
-                WHERE date >= :date_filter AND type = :currency AND bank = :bank
-                  AND {rate_col} IS NOT NULL
-                ORDER BY date, crawl_time DESC
-            ) s ORDER BY date DESC
-        """)
-
-        with get_engine_crawl().connect() as conn:
-            rows = conn.execute(query, {
-                "date_filter": date_filter, "currency": currency_upper, "bank": bank_upper
-            }).fetchall()
-
-        dates     = [r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]) for r in rows]
-        rates     = [float(r[1]) if r[1] else 0    for r in rows]
-        buy_cash  = [float(r[2]) if r[2] else None for r in rows]
-        sell      = [float(r[3]) if r[3] else None for r in rows]
-
-        rows_asc = list(zip(dates[::-1], rates[::-1], buy_cash[::-1], sell[::-1]))
+        rate_col = "usd_vnd_rate" if bank_upper == "SBV" else "buy_transfer"
+        dates, rates, buy_cash, sell = await _fetch_series(f"fx_{rate_col}", {
+            "date_filter": get_date_filter(period), "currency": currency_upper, "bank": bank_upper
+        }, 4)
 
         if page is not None:
-            page_rows, total = _paginate(rows_asc, page, limit)
+            page_rows, total = _paginate(list(zip(dates, rates, buy_cash, sell)), page, limit)
             data = [{"date": r[0], "buy": r[1], "buy_cash": r[2], "sell": r[3]} for r in page_rows]
             return _json_response({"success": True, "data": data,
                                    "total": total, "page": page, "limit": limit,
@@ -252,8 +289,8 @@ async def get_sbv_central_rate(
                                    "bank": bank_upper, "currency": currency_upper, "period": period})
 
         return _json_response({"success": True,
-                               "data": {"dates": dates[::-1], "usd_vnd_rate": rates[::-1],
-                                        "buy_cash": buy_cash[::-1], "sell_rate": sell[::-1]},
+                               "data": {"dates": dates, "usd_vnd_rate": rates,
+                                        "buy_cash": buy_cash, "sell_rate": sell},
                                "period": period, "bank": bank_upper, "currency": currency_upper, "count": len(dates)})
     except HTTPException:
         raise
@@ -262,40 +299,21 @@ async def get_sbv_central_rate(
 
 
 @router.get("/api/v1/termdepo")
+@cached_response
 async def get_term_deposit_data(
     request: Request,
-    period: str = Query("1m", description="Time period: 7d, 1m, 1y, all"),
+    period: str = Query("1m", pattern=PERIOD_PATTERN, description=PERIOD_DESCRIPTION),
     bank: str = Query("ACB", description="Bank code"),
     page: int = Query(None, ge=1),
     limit: int = Query(30, ge=1, le=500),
 ):
     try:
-        date_filter = get_date_filter(period)
-        query = text("""
-            SELECT date, term_1m, term_3m, term_6m, term_12m, term_24m
-            FROM (
-                SELECT DISTINCT ON (date_trunc('month', date))
-                       date, term_1m, term_3m, term_6m, term_12m, term_24m, crawl_time
-                FROM vn_macro_termdepo_daily
-                WHERE date >= :date_filter AND bank_code = :bank_code
-                ORDER BY date_trunc('month', date), date DESC, crawl_time DESC
-            ) s ORDER BY date DESC
-        """)
-        with get_engine_crawl().connect() as conn:
-            rows = conn.execute(query, {"date_filter": date_filter, "bank_code": bank}).fetchall()
-
-        dates    = [r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]) for r in rows]
-        term_1m  = [float(r[1]) if r[1] else 0 for r in rows]
-        term_3m  = [float(r[2]) if r[2] else 0 for r in rows]
-        term_6m  = [float(r[3]) if r[3] else 0 for r in rows]
-        term_12m = [float(r[4]) if r[4] else 0 for r in rows]
-        term_24m = [float(r[5]) if r[5] else 0 for r in rows]
-
-        rows_asc = list(zip(dates[::-1], term_1m[::-1], term_3m[::-1],
-                            term_6m[::-1], term_12m[::-1], term_24m[::-1]))
+        dates, term_1m, term_3m, term_6m, term_12m, term_24m = await _fetch_series(
+            "termdepo", {"date_filter": get_date_filter(period), "bank_code": bank}, 6)
 
         if page is not None:
-            page_rows, total = _paginate(rows_asc, page, limit)
+            page_rows, total = _paginate(list(zip(dates, term_1m, term_3m, term_6m, term_12m, term_24m)),
+                                         page, limit)
             data = [{"date": r[0], "term_1m": r[1], "term_3m": r[2],
                      "term_6m": r[3], "term_12m": r[4], "term_24m": r[5]} for r in page_rows]
             return _json_response({"success": True, "data": data,
@@ -303,9 +321,9 @@ async def get_term_deposit_data(
                                    "pages": (total + limit - 1) // limit, "bank": bank, "period": period})
 
         return _json_response({"success": True,
-                               "data": {"dates": dates[::-1], "term_1m": term_1m[::-1],
-                                        "term_3m": term_3m[::-1], "term_6m": term_6m[::-1],
-                                        "term_12m": term_12m[::-1], "term_24m": term_24m[::-1]},
+                               "data": {"dates": dates, "term_1m": term_1m,
+                                        "term_3m": term_3m, "term_6m": term_6m,
+                                        "term_12m": term_12m, "term_24m": term_24m},
                                "bank": bank, "period": period, "count": len(dates)})
     except HTTPException:
         raise
@@ -314,12 +332,12 @@ async def get_term_deposit_data(
 
 
 @router.get("/api/v1/termdepo/banks")
+@cached_response
 async def get_bank_types(request: Request):
     try:
-        with get_engine_crawl().connect() as conn:
-            rows = conn.execute(text(
-                "SELECT DISTINCT bank_code FROM vn_macro_termdepo_daily WHERE bank_code IS NOT NULL ORDER BY bank_code"
-            )).fetchall()
+        rows = await run_in_threadpool(_fetch_rows, text(
+            "SELECT DISTINCT bank_code FROM vn_macro_termdepo_daily WHERE bank_code IS NOT NULL ORDER BY bank_code"
+        ))
         return _json_response({"success": True, "banks": [r[0] for r in rows if r[0]]})
     except HTTPException:
         raise
@@ -329,28 +347,17 @@ async def get_bank_types(request: Request):
 
 @router.get("/api/v1/global")
 @router.get("/api/v1/global-macro")
+@cached_response
 async def get_global_macro_data(
     request: Request,
-    period: str = Query("1m", description="Time period: 7d, 1m, 1y, all"),
+    period: str = Query("1m", pattern=PERIOD_PATTERN, description=PERIOD_DESCRIPTION),
     symbol: str = Query(None, description="Filter by symbol: GC=F, SI=F, ^IXIC"),
     page: int = Query(None, ge=1),
     limit: int = Query(30, ge=1, le=500),
 ):
     try:
-        date_filter = get_date_filter(period)
-        with get_engine_global().connect() as conn:
-            rows = list(reversed(conn.execute(text("""
-                SELECT date, gold_price, silver_price, nasdaq_price FROM (
-                    SELECT DISTINCT ON (date) date, gold_price, silver_price, nasdaq_price, crawl_time
-                    FROM global_macro WHERE date >= :date_filter
-                    ORDER BY date, crawl_time DESC
-                ) s ORDER BY date DESC
-            """), {"date_filter": date_filter}).fetchall()))
-
-        dates   = [r[0].strftime("%Y-%m-%d") if hasattr(r[0], "strftime") else str(r[0]) for r in rows]
-        gold    = [float(r[1]) if r[1] else 0 for r in rows]
-        silver  = [float(r[2]) if r[2] else 0 for r in rows]
-        nasdaq  = [float(r[3]) if r[3] else 0 for r in rows]
+        dates, gold, silver, nasdaq = await _fetch_series(
+            "global", {"date_filter": get_date_filter(period)}, 4, get_engine=get_engine_global)
 
         if page is not None:
             page_rows, total = _paginate(list(zip(dates, gold, silver, nasdaq)), page, limit)
@@ -368,3 +375,44 @@ async def get_global_macro_data(
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch global macro data: {e}")
+
+
+# Column names per series, in _SERIES_SQL order — same keys as the single-series
+# endpoints' "data" objects so the FE can feed either into the same chart code.
+_DASHBOARD_KEYS = {
+    "gold":          ("dates", "buy_prices", "sell_prices"),
+    "silver":        ("dates", "buy_prices", "sell_prices"),
+    "sbv_interbank": ("dates", "overnight", "month_1", "month_3", "month_6", "month_9",
+                      "rediscount", "refinancing"),
+    "termdepo":      ("dates", "term_1m", "term_3m", "term_6m", "term_12m", "term_24m"),
+    "global":        ("dates", "gold_prices", "silver_prices", "nasdaq_prices"),
+}
+
+
+@router.get("/api/v1/dashboard")
+@cached_response
+async def get_dashboard_data(
+    request: Request,
+    period: str = Query("1m", pattern=PERIOD_PATTERN, description=PERIOD_DESCRIPTION),
+    type: str = Query("DOJI HN", description="Gold type"),
+    bank: str = Query("ACB", description="Term deposit bank code"),
+):
+    """Gold, silver, SBV interbank, term deposit và global macro trong 1 response.
+    5 query chạy song song (mỗi query 1 connection riêng từ pool) nên latency
+    ≈ query chậm nhất thay vì tổng của 5 request riêng lẻ."""
+    try:
+        date_filter = get_date_filter(period)
+        series = await asyncio.gather(
+            _fetch_series("gold", {"date_filter": date_filter, "gold_type": type}, 3),
+            _fetch_series("silver", {"date_filter": date_filter}, 3),
+            _fetch_series("sbv_interbank", {"date_filter": date_filter}, 8),
+            _fetch_series("termdepo", {"date_filter": date_filter, "bank_code": bank}, 6),
+            _fetch_series("global", {"date_filter": date_filter}, 4, get_engine=get_engine_global),
+        )
+        data = {name: dict(zip(keys, cols)) for (name, keys), cols in zip(_DASHBOARD_KEYS.items(), series)}
+        return _json_response({"success": True, "data": data,
+                               "type": type, "bank": bank, "period": period})
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch dashboard data: {e}")
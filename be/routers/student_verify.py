@@ -21,9 +21,8 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from sqlalchemy import text
-from sqlalchemy.orm import sessionmaker
 
-from core.engines import get_engine_user
+from core.engines import get_engine_user, get_session_user
 from core.email import send_otp_email
 from middleware import authenticate_user
 
@@ -33,7 +32,7 @@ STUDENT_DOMAIN_SUFFIX = ".edu.vn"
 
 
 def _session():
-    return sessionmaker(bind=get_engine_user())()
+    return get_session_user()
 
 
 def _ensure_student_tables(conn):
@@ -10,12 +10,15 @@ VN30 Financial Data API Router
 - /api/v1/macro/trade          — Free: Import/export monthly
 """
 
-import json
+from datetime import date
+
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
-from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+import orjson
 from sqlalchemy import text
 
-from core.engines import get_engine_crawl, get_engine_corp
+from core.engines import UNCAP_TRANSACTION_SQL, get_engine_crawl, get_engine_corp
 from middleware import authenticate_user_optional
 
 router = APIRouter()
@@ -24,9 +27,86 @@ PREMIUM_LEVELS = ("premium", "premium_developer", "admin")
 
 
 def _json_response(data: dict) -> Response:
-    raw = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
-    return Response(content=raw, media_type="application/json",
-                    headers={"Content-Length": str(len(raw))})
+    # orjson: UTF-8 bytes directly; default=str keeps Decimal columns as before
+    raw = orjson.dumps(data, default=str)
+    return Response(content=raw, media_type="application/json")
+
+
+_DOWNLOAD_BATCH = 1000
+_UNCAP_TRANSACTION = text(UNCAP_TRANSACTION_SQL)
+
+# period=all on the bulk downloads: everything since the first stored year
+_ALL_SINCE = date(2000, 1, 1)
+
+
+def _open_rows(stmt, params: dict):
+    """Run `stmt` on a server-side cursor (stream_results) and fetch the first
+    batch, so connection and query errors surface here, before any byte of a
+    StreamingResponse is sent. Returns (conn, result, first batch); the caller
+    hands them to _iter_json_rows, which closes the connection."""
+    conn = get_engine_corp().connect()
+    try:
+        # Lift the API session caps: a slow client leaves this transaction
+        # idle between batches for as long as it takes to read one
+        conn.execute(_UNCAP_TRANSACTION)
+        result = conn.execution_options(
+            stream_results=True, yield_per=_DOWNLOAD_BATCH,
+        ).execute(stmt, params)
+        return conn, result, result.fetchmany(_DOWNLOAD_BATCH)
+    except Exception:
+        conn.close()
+        raise
+
+
+def _iter_json_rows(conn, result, first, row_fn):
+    """Yield {"success", "data", "count"} as JSON bytes, one chunk per
+    _DOWNLOAD_BATCH rows, so an all-ticker period=all download is never held
+    in memory as a full result plus a list of dicts. count comes after data
+    because it is only known once the cursor is drained."""
+    try:
+        yield b'{"success":true,"data":['
+        count = 0
+        batch = first
+        while batch:
+            chunk = b",".join(orjson.dumps(row_fn(r), default=str) for r in batch)
+            yield (b"," + chunk) if count else chunk
+            count += len(batch)
+            batch = result.fetchmany(_DOWNLOAD_BATCH)
+        yield b'],"count":%d}' % count
+    finally:
+        conn.close()
+
+
+async def _stream_download(stmt, params: dict, row_fn) -> StreamingResponse:
+    try:
+        conn, result, first = await run_in_threadpool(_open_rows, stmt, params)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed: {e}")
+    return StreamingResponse(
+        _iter_json_rows(conn, result, first, row_fn), media_type="application/json",
+    )
+
+
+def _download_days(period: str, days_map: dict) -> int:
+    if period == "all":
+        return (date.today() - _ALL_SINCE).days
+    return days_map.get(period, 365)
+
+
+_SELECT_DOWNLOAD_PRICES = text("""
+    SELECT ticker, date, open, high, low, close, volume, value
+    FROM vn30_ohlcv_daily
+    WHERE date >= CURRENT_DATE - :days
+    ORDER BY ticker ASC, date ASC
+""")
+
+_SELECT_DOWNLOAD_RATIOS = text("""
+    SELECT ticker, date, pe, pb, ps, roe, roa, eps,
+           dividend_yield, market_cap_billion
+    FROM vn30_ratio_daily
+    WHERE date >= CURRENT_DATE - :days
+    ORDER BY ticker ASC, date ASC
+""")
 
 
 def _is_premium(request: Request) -> bool:
@@ -142,9 +222,9 @@ async def get_vn30_prices(
                 SELECT date, open, high, low, close, volume, value
                 FROM vn30_ohlcv_daily
                 WHERE ticker = :ticker
-                  AND date >= CURRENT_DATE - INTERVAL ':days days'
+                  AND date >= CURRENT_DATE - :days
                 ORDER BY date ASC
-            """.replace(':days', str(period_days))), {"ticker": ticker.upper()}).fetchall()
+            """), {"ticker": ticker.upper(), "days": period_days}).fetchall()
 
         data = [{
             "date": str(r[0]),
@@ -244,9 +324,9 @@ async def get_vn30_ratios(
                 SELECT date, pe, pb, ps, roe, roa, eps, dividend_yield, market_cap_billion
                 FROM vn30_ratio_daily
                 WHERE ticker = :ticker
-                  AND date >= CURRENT_DATE - INTERVAL ':days days'
+                  AND date >= CURRENT_DATE - :days
                 ORDER BY date ASC
-            """.replace(':days', str(period_days))), {"ticker": ticker.upper()}).fetchall()
+            """), {"ticker": ticker.upper(), "days": period_days}).fetchall()
 
         data = [{
             "date": str(r[0]), "pe": r[1], "pb": r[2], "ps": r[3],
@@ -448,22 +528,12 @@ async def download_vn30_prices(
     """VN30 OHLCV prices all tickers — premium."""
     if not _is_premium(request):
         raise HTTPException(status_code=403, detail="Premium required")
-    days_map = {"7d": 7, "1m": 30, "1y": 365}
-    date_filter = f"CURRENT_DATE - INTERVAL '{days_map.get(period, 365)} days'" if period != "all" else "'2000-01-01'::date"
-    try:
-        with get_engine_corp().connect() as conn:
-            rows = conn.execute(text(f"""
-                SELECT ticker, date, open, high, low, close, volume, value
-                FROM vn30_ohlcv_daily
-                WHERE date >= {date_filter}
-                ORDER BY ticker ASC, date ASC
-            """)).fetchall()
-        data = [{"ticker": r[0], "date": str(r[1]), "open": r[2], "high": r[3],
-                 "low": r[4], "close": r[5], "volume": r[6], "value": r[7]}
-                for r in rows]
-        return _json_response({"success": True, "count": len(data), "data": data})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed: {e}")
+    days = _download_days(period, {"7d": 7, "1m": 30, "1y": 365})
+    return await _stream_download(
+        _SELECT_DOWNLOAD_PRICES, {"days": days},
+        lambda r: {"ticker": r[0], "date": str(r[1]), "open": r[2], "high": r[3],
+                   "low": r[4], "close": r[5], "volume": r[6], "value": r[7]},
+    )
 
 
 @router.get("/api/v1/vn30/download/financials")
@@ -499,21 +569,10 @@ async def download_vn30_ratios(
     """VN30 daily financial ratios all tickers — premium."""
     if not _is_premium(request):
         raise HTTPException(status_code=403, detail="Premium required")
-    days_map = {"1m": 30, "1y": 365}
-    date_filter = f"CURRENT_DATE - INTERVAL '{days_map.get(period, 365)} days'" if period != "all" else "'2000-01-01'::date"
-    try:
-        with get_engine_corp().connect() as conn:
-            rows = conn.execute(text(f"""
-                SELECT ticker, date, pe, pb, ps, roe, roa, eps,
-                       dividend_yield, market_cap_billion
-                FROM vn30_ratio_daily
-                WHERE date >= {date_filter}
-                ORDER BY ticker ASC, date ASC
-            """)).fetchall()
-        data = [{"ticker": r[0], "date": str(r[1]), "pe": r[2], "pb": r[3],
-                 "ps": r[4], "roe": r[5], "roa": r[6], "eps": r[7],
-                 "dividend_yield": r[8], "market_cap_billion": r[9]}
-                for r in rows]
-        return _json_response({"success": True, "count": len(data), "data": data})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed: {e}")
+    days = _download_days(period, {"1m": 30, "1y": 365})
+    return await _stream_download(
+        _SELECT_DOWNLOAD_RATIOS, {"days": days},
+        lambda r: {"ticker": r[0], "date": str(r[1]), "pe": r[2], "pb": r[3],
+                   "ps": r[4], "roe": r[5], "roa": r[6], "eps": r[7],
+                   "dividend_yield": r[8], "market_cap_billion": r[9]},
+    )
@@ -17,7 +17,8 @@ from typing import Any
 
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
-ALLOWED_EXTS = {".md", ".json", ".yaml", ".yml", ".csv", ".txt"}
+ALLOWED_EXTS = frozenset({".md", ".json", ".yaml", ".yml", ".csv", ".txt"})
+_ALLOWED_EXTS_DISPLAY = str(sorted(ALLOWED_EXTS))  # rejection message, built once
 
 # Magic byte → human-readable label. Keys are checked as prefix of file bytes.
 MAGIC_SIGNATURES: list[tuple[bytes, str]] = [
@@ -84,7 +85,7 @@ def scan_file(data: bytes, filename: str) -> dict[str, Any]:
     # 3. Extension check
     ext = os.path.splitext(filename.lower())[1]
     if ext not in ALLOWED_EXTS:
-        return _infected(f"Extension not allowed: '{ext}' — accepted: {sorted(ALLOWED_EXTS)}")
+        return _infected(f"Extension not allowed: '{ext}' — accepted: {_ALLOWED_EXTS_DISPLAY}")
 
     # 4. Magic byte check
     for sig, label in MAGIC_SIGNATURES:
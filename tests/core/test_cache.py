@@ -0,0 +1,108 @@
+import pytest
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from be.core import cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+def test_ttl_cache_expires(clock):
+    c = cache.TTLCache(ttl=10)
+    c.set("k", "v")
+    clock.now += 9.9
+    assert c.get("k") == "v"
+    clock.now += 0.1
+    assert c.get("k") is None
+
+
+def test_ttl_cache_evicts_oldest_when_full(clock):
+    c = cache.TTLCache(ttl=10, maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.set("c", 3)
+    assert c.get("a") is None
+    assert (c.get("b"), c.get("c")) == (2, 3)
+
+
+def test_ttl_cache_evicts_expired_before_live(clock):
+    c = cache.TTLCache(ttl=10, maxsize=2)
+    c.set("a", 1)
+    clock.now += 5
+    c.set("b", 2)
+    clock.now += 6  # "a" expired, "b" still live
+    c.set("c", 3)
+    assert (c.get("b"), c.get("c")) == (2, 3)
+
+
+@pytest.fixture
+def client():
+    cache._responses.clear()
+    calls = []
+    app = FastAPI()
+
+    @app.get("/series")
+    @cache.cached_response
+    async def series(request: Request, period: str = Query("1m"), type: str = Query("A")):
+        calls.append((period, type))
+        if period == "bad":
+            return Response(status_code=404)
+        return Response(content=f"{period}:{type}".encode(), media_type="application/json")
+
+    yield TestClient(app), calls
+    cache._responses.clear()
+
+
+def test_cached_response_reuses_body(client):
+    tc, calls = client
+    first = tc.get("/series?period=1y")
+    second = tc.get("/series?period=1y")
+    assert first.content == second.content == b"1y:A"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert second.headers["cache-control"] == f"private, max-age={cache.RESPONSE_CACHE_TTL}"
+    assert calls == [("1y", "A")]
+
+
+def test_cached_response_keys_on_query_params(client):
+    tc, calls = client
+    assert tc.get("/series?period=1y&type=A").content == b"1y:A"
+    assert tc.get("/series?period=1y&type=B").content == b"1y:B"
+    assert tc.get("/series?period=7d&type=A").content == b"7d:A"
+    assert calls == [("1y", "A"), ("1y", "B"), ("7d", "A")]
+
+
+def test_cached_response_304_on_matching_etag(client):
+    tc, calls = client
+    etag = tc.get("/series").headers["etag"]
+    assert etag.startswith('W/"')
+
+    hit = tc.get("/series", headers={"If-None-Match": f'"other", {etag}'})
+    assert hit.status_code == 304
+    assert hit.content == b""
+    assert hit.headers["etag"] == etag
+
+    miss = tc.get("/series", headers={"If-None-Match": 'W/"stale"'})
+    assert miss.status_code == 200
+    assert miss.content == b"1m:A"
+    assert calls == [("1m", "A")]
+
+
+def test_cached_response_skips_errors(client):
+    tc, calls = client
+    assert tc.get("/series?period=bad").status_code == 404
+    assert tc.get("/series?period=bad").status_code == 404
+    assert calls == [("bad", "A"), ("bad", "A")]
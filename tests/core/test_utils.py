@@ -0,0 +1,58 @@
+import re
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from be.core import utils
+
+PACKS_DIR = Path(__file__).resolve().parents[2] / "content" / "knowledge_packs"
+
+
+@pytest.mark.parametrize("period", ["7d", "1m", "30d", "3m", "90d", "6m", "1y", "2y", "3y", "all"])
+def test_period_pattern_accepts(period):
+    assert re.search(utils.PERIOD_PATTERN, period)
+
+
+@pytest.mark.parametrize("period", ["", "5y", "1d", "ALL", "1y ", "6m;drop"])
+def test_period_pattern_rejects(period):
+    assert not re.search(utils.PERIOD_PATTERN, period)
+
+
+def test_period_pattern_covers_knowledge_packs():
+    used = {m for p in PACKS_DIR.rglob("*") if p.is_file()
+            for m in re.findall(r"period=(\w+)", p.read_text(encoding="utf-8", errors="ignore"))}
+    assert used
+    assert not [p for p in used if not re.search(utils.PERIOD_PATTERN, p)]
+
+
+@pytest.mark.parametrize("period,expected", [
+    ("3m", "2026-01-16"), ("6m", "2025-10-18"), ("2y", "2024-04-16"), ("3y", "2023-04-17"),
+    ("all", "2000-01-01"),
+])
+def test_date_filter_periods(period, expected):
+    assert utils._date_filter(period, date(2026, 4, 16)) == expected
+
+
+def test_get_date_filter_rolls_over_at_midnight(monkeypatch):
+    today = [date(2026, 4, 16)]
+
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return today[0]
+
+    monkeypatch.setattr(utils, "date", FakeDate)
+    assert utils.get_date_filter("7d") == "2026-04-09"
+    today[0] = date(2026, 4, 17)
+    assert utils.get_date_filter("7d") == "2026-04-10"
+
+
+def test_get_date_filter_unknown_period_is_all():
+    assert utils.get_date_filter("bogus") == "2000-01-01"
+
+
+def test_period_description_lists_accepted_periods():
+    listed = utils.PERIOD_DESCRIPTION.split(": ", 1)[1].split(", ")
+    assert all(re.search(utils.PERIOD_PATTERN, p) for p in listed)
+    assert set(listed) == {*utils._PERIOD_DAYS, "all"}
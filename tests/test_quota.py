@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from be import quota
+
+
+@pytest.fixture
+def engine():
+    eng = create_engine("sqlite://")
+
+    @event.listens_for(eng, "connect")
+    def _now(dbapi_conn, _):
+        dbapi_conn.create_function("NOW", 0, lambda: "2026-01-01 00:00:00")
+
+    with eng.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE api_usage_monthly (
+                user_id INTEGER, quota_month TEXT, request_count INTEGER,
+                updated_at TEXT, PRIMARY KEY (user_id, quota_month)
+            )
+        """))
+    quota._BUCKETS.clear()
+    yield eng
+    quota._BUCKETS.clear()
+
+
+def _used(conn, user_id):
+    return quota._read_used(conn, user_id)
+
+
+def test_request_units():
+    assert quota.request_units("/api/v1/dashboard") == 5
+    assert quota.request_units("/api/v1/dashboard/") == 5
+    assert quota.request_units("/api/v1/gold") == 1
+
+
+def test_consume_counts_units(engine):
+    with engine.begin() as conn:
+        q1 = quota.check_and_consume(conn, user_id=1, user_level="premium_developer", plan=None)
+        q5 = quota.check_and_consume(conn, user_id=1, user_level="premium_developer", plan=None,
+                                     units=5)
+        assert (q1.allowed, q5.allowed) == (True, True)
+        assert q5.used_this_month == 6
+        assert q5.remaining == 10_000 - 6
+
+
+def test_consume_rejects_units_past_limit_without_charging(engine):
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO api_usage_monthly VALUES (2, :qm, 997, NULL)"
+        ), {"qm": quota.current_quota_month()})
+        q = quota.check_and_consume(conn, user_id=2, user_level="free", plan=None, units=5)
+        assert not q.allowed and q.reason == "monthly"
+        assert _used(conn, 2) == 997
+
+        q = quota.check_and_consume(conn, user_id=2, user_level="free", plan=None, units=3)
+        assert q.allowed and q.remaining == 0